@@ -20,17 +20,21 @@
 ## See the License for the specific language governing permissions and
 ## limitations under the License.
 
-import struct
-from typing import Any, Callable, Final, List, Optional, Tuple
+from concurrent.futures import Future
+from itertools import chain
+from time import monotonic
+from typing import Any, Callable, Final, Iterator, List, Optional, Tuple
 
-from qiskit import BasicAer, QuantumCircuit, execute
+from qiskit import BasicAer, QuantumCircuit, execute, transpile
 from qiskit.providers import Backend, Job, Provider
 from qiskit.providers.ibmq import IBMQError, least_busy
 from qiskit.providers.models import BackendConfiguration
 from qiskit.result import Counts, Result
+from qiskit.transpiler import PassManager
 
 from .caches import BasicCache as BitCache
 from .errors import raise_future_warning
+from .helpers import validate_type
 from .quantum_bit_generator import QuantumBitGenerator
 
 ###############################################################################
@@ -74,6 +78,9 @@ class QiskitBitGenerator(QuantumBitGenerator):
         `random_raw()` method, and the default number of bits to output on
         `random_uint()` and `random_double()`. Once an object is instantiated,
         this cannot be overridden.
+    backend_ttl: float = 30.0
+        Seconds during which the backend chosen from the `provider` is reused
+        before querying it again for the least busy one. Must be non-negative.
 
     NOTES
     -----
@@ -84,7 +91,8 @@ class QiskitBitGenerator(QuantumBitGenerator):
     number of bits to retrieve on each request through the
     `max_bits_per_request` parameter.
     Additionally, it always chooses the least busy backend from the list of
-    machines available to the given provider. This list can be filtered by the
+    machines available to the given provider (reusing that choice for
+    `backend_ttl` seconds between requests). This list can be filtered by the
     user through the `backend_filter` parameter, which defaults to history-
     enabled non-simulators. If a Qiskit Backend is explicitly passed in as
     parameter, no backend selection will be performed: effectively ignoring any
@@ -108,6 +116,7 @@ class QiskitBitGenerator(QuantumBitGenerator):
         backend_filter: Optional[BackendFilter] = None,
         max_bits_per_request: int = 0,
         ISRAW32: bool = False,
+        backend_ttl: float = 30.0,
     ) -> None:
         raise_future_warning(
             "QiskitBitGenerator",
@@ -124,13 +133,18 @@ class QiskitBitGenerator(QuantumBitGenerator):
         else:
             backend = BasicAer.get_backend("qasm_simulator")
         self._provider: Optional[Provider] = provider
-        self._backend: Backend = backend
+        self.__backend_expiry: float = 0.0
+        self._set_backend_ttl(backend_ttl)
+        self._set_backend(backend)
         self._backend_filter: Optional[BackendFilter] = backend_filter
         self._set_mbpr(max_bits_per_request)
         self._ISRAW32: Final[bool] = ISRAW32  # type: ignore
+        self._BITS: Final[int] = 32 if ISRAW32 else 64  # type: ignore
         self._bitcache: BitCache = BitCache()
+        self._prefetch: bool = False
+        self._prefetched: Optional[Future] = None
         super(QuantumBitGenerator, self).__init__(
-            bits=self.BITS,
+            bits=self._BITS,
             next_raw=self._next_raw,
             next_32=self._next_32,
             next_64=self._next_64,
@@ -247,7 +261,7 @@ class QiskitBitGenerator(QuantumBitGenerator):
             Bitstring of lenght `n_bits`.
         """
         if n_bits < 1:
-            n_bits = self.BITS
+            n_bits = self._BITS
         while self._bitcache.size < n_bits:
             self._fetch_random_bits()
         return self._bitcache.pop(n_bits)
@@ -268,8 +282,10 @@ class QiskitBitGenerator(QuantumBitGenerator):
             Unsigned int of `n_bits` bits.
         """
         if n_bits < 1:
-            n_bits = self.BITS
-        return int(self.random_bitstring(n_bits), 2)
+            n_bits = self._BITS
+        while self._bitcache.size < n_bits:
+            self._fetch_random_bits()
+        return self._bitcache.pop_uint(n_bits)
 
     def set_state(
         self,
@@ -277,6 +293,7 @@ class QiskitBitGenerator(QuantumBitGenerator):
         backend: Optional[Backend] = None,
         backend_filter: Optional[BackendFilter] = None,
         max_bits_per_request: Optional[int] = None,
+        backend_ttl: Optional[float] = None,
     ) -> bool:
         """
         Override constructor parameters.
@@ -292,6 +309,8 @@ class QiskitBitGenerator(QuantumBitGenerator):
             Same as constructor.
         max_bits_per_request: Optional[int] = None
             Same as constructor.
+        backend_ttl: Optional[float] = None
+            Same as constructor.
 
         RETURNS
         -------
@@ -302,41 +321,90 @@ class QiskitBitGenerator(QuantumBitGenerator):
         if max_bits_per_request is not None:
             change = True
             self._set_mbpr(max_bits_per_request)
+        if backend_ttl is not None:
+            change = True
+            self._set_backend_ttl(backend_ttl)
         if backend_filter:
             change = True
             self._backend_filter = backend_filter
+            self.__backend_expiry = 0.0
         if backend:
             change = True
             self._provider = None
-            self._backend = backend
+            self._set_backend(backend)
         elif provider:
             change = True
             self._provider = provider
-            self._backend = self.get_best_backend(
-                provider=provider,
-                backend_filter=self._backend_filter,
+            self._set_backend(
+                self.get_best_backend(
+                    provider=provider,
+                    backend_filter=self._backend_filter,
+                )
             )
         return change
 
     ############################# PRIVATE METHODS #############################
     def _fetch_random_bits(self) -> bool:
-        if self._provider:
-            self._backend = self.get_best_backend(
-                provider=self._provider,
-                backend_filter=self._backend_filter,
+        if self._provider and monotonic() >= self.__backend_expiry:
+            self._set_backend(
+                self.get_best_backend(
+                    provider=self._provider,
+                    backend_filter=self._backend_filter,
+                )
             )
-        circuits: List[QuantumCircuit] = [self._circuit] * self._experiments
         job: Job = execute(
-            circuits,
+            [self._transpiled_circuit] * self._experiments,
             self._backend,
             shots=self._shots,
             memory=self._memory,
+            pass_manager=PassManager(),  # Already transpiled
         )
         result: Result = job.result()
         bitstring: str = self._parse_result(result)
         self._bitcache.push(bitstring)
         return True
 
+    def _refill_cache(self, num_bits: int = 1) -> None:
+        while self._bitcache.size < num_bits:
+            self._fetch_random_bits()
+
+    def _compute_job_partition(self) -> Tuple[int, int, int]:
+        backend_config: dict = self._backend_config
+        experiments: int = (
+            backend_config["max_experiments"]
+            if "max_experiments" in backend_config
+            and backend_config["max_experiments"]
+            else 1
+        )
+        shots: int = (
+            backend_config["max_shots"]
+            if "max_shots" in backend_config
+            and backend_config["max_shots"]
+            and "memory" in backend_config
+            and backend_config["memory"]
+            else 1
+        )
+        n_qubits: int = (
+            backend_config["n_qubits"]
+            if "n_qubits" in backend_config and backend_config["n_qubits"]
+            else 1
+        )
+        max_bits_per_request: int = self._max_bits_per_request or 0
+        if max_bits_per_request > n_qubits:
+            experiments = min(
+                experiments,
+                max_bits_per_request // (shots * n_qubits) + 1,
+            )
+            shots = min(
+                shots,
+                max_bits_per_request // (experiments * n_qubits),
+            )
+        elif max_bits_per_request > 0:
+            experiments = 1
+            shots = 1
+            n_qubits = max_bits_per_request
+        return n_qubits, shots, experiments
+
     def _parse_backend_config(self, backend_config: dict) -> dict:
         keys = backend_config.keys()
         config: dict = {}
@@ -345,24 +413,37 @@ class QiskitBitGenerator(QuantumBitGenerator):
         return config
 
     def _parse_result(self, result: Result) -> str:
-        measurements: List[str] = []
         if self._memory:
-            for e in range(self._experiments):
-                measurements += result.get_memory(e)
-        else:
-            cts = result.get_counts()
-            counts: List[Counts] = [cts] if type(cts) != list else cts
-            for c in counts:
-                measurements += [k for k, v in c.items() if v == 1]
-        bitstring: str = ""
-        for m in measurements:
-            bitstring += m
-        return bitstring
+            memories: Iterator[List[str]] = (
+                result.get_memory(e) for e in range(self._experiments)
+            )
+            return "".join(chain.from_iterable(memories))
+        cts = result.get_counts()
+        counts: List[Counts] = [cts] if type(cts) != list else cts
+        return "".join(k for c in counts for k, v in c.items() if v == 1)
+
+    def _set_backend(self, backend: Backend) -> bool:
+        self._backend: Backend = backend
+        self.__backend_expiry = monotonic() + self._backend_ttl
+        self.__backend_config: Optional[dict] = None
+        self.__job_partition: Optional[Tuple[int, int, int]] = None
+        self.__transpiled_circuit: Optional[QuantumCircuit] = None
+        return True
+
+    def _set_backend_ttl(self, backend_ttl: float) -> bool:
+        validate_type(backend_ttl, (int, float))
+        if backend_ttl < 0:
+            raise ValueError(f"Invalid negative backend TTL: {backend_ttl}.")
+        self._backend_ttl: float = float(backend_ttl)
+        self.__backend_expiry = 0.0
+        return True
 
     def _set_mbpr(self, max_bits_per_request: int) -> bool:
         self._max_bits_per_request = (
             max_bits_per_request if max_bits_per_request > 0 else 0
         )
+        self.__job_partition = None
+        self.__transpiled_circuit = None
         return True
 
     ############################ PUBLIC PROPERTIES ############################
@@ -377,6 +458,7 @@ class QiskitBitGenerator(QuantumBitGenerator):
             "backend_config": self._parse_backend_config(self._backend_config),
             "dynamic_backend": {
                 "filter": "Custom" if self._backend_filter else "Default",
+                "ttl": self._backend_ttl,
             },
             "bitcache": {"size": self._bitcache.size},
         }
@@ -394,7 +476,9 @@ class QiskitBitGenerator(QuantumBitGenerator):
     ########################### PRIVATE PROPERTIES ###########################
     @property
     def _backend_config(self) -> dict:
-        return self._backend.configuration().to_dict()
+        if self.__backend_config is None:
+            self.__backend_config = self._backend.configuration().to_dict()
+        return self.__backend_config
 
     @property
     def _circuit(self) -> QuantumCircuit:
@@ -423,42 +507,9 @@ class QiskitBitGenerator(QuantumBitGenerator):
 
     @property
     def _job_partition(self) -> Tuple[int, int, int]:
-        backend_config: dict = self._backend_config
-        experiments: int = (
-            backend_config["max_experiments"]
-            if backend_config.__contains__("max_experiments")
-            and backend_config["max_experiments"]
-            else 1
-        )
-        shots: int = (
-            backend_config["max_shots"]
-            if backend_config.__contains__("max_shots")
-            and backend_config["max_shots"]
-            and backend_config.__contains__("memory")
-            and backend_config["memory"]
-            else 1
-        )
-        n_qubits: int = (
-            backend_config["n_qubits"]
-            if backend_config.__contains__("n_qubits")
-            and backend_config["n_qubits"]
-            else 1
-        )
-        max_bits_per_request: int = self._max_bits_per_request or 0
-        if max_bits_per_request > n_qubits:
-            experiments = min(
-                experiments,
-                max_bits_per_request // (shots * n_qubits) + 1,
-            )
-            shots = min(
-                shots,
-                max_bits_per_request // (experiments * n_qubits),
-            )
-        elif max_bits_per_request > 0:
-            experiments = 1
-            shots = 1
-            n_qubits = max_bits_per_request
-        return n_qubits, shots, experiments
+        if self.__job_partition is None:
+            self.__job_partition = self._compute_job_partition()
+        return self.__job_partition
 
     @property
     def _memory(self) -> bool:
@@ -473,3 +524,9 @@ class QiskitBitGenerator(QuantumBitGenerator):
     def _shots(self) -> int:
         n_qubits, shots, experiments = self._job_partition
         return shots
+
+    @property
+    def _transpiled_circuit(self) -> QuantumCircuit:
+        if self.__transpiled_circuit is None:
+            self.__transpiled_circuit = transpile(self._circuit, self._backend)
+        return self.__transpiled_circuit
@@ -20,10 +20,23 @@
 ## See the License for the specific language governing permissions and
 ## limitations under the License.
 
+from struct import Struct
+from typing import Dict, Final, Optional
+
 from ..errors import raise_future_warning
 from ..helpers import ALPHABETS, validate_natural, validate_numeral
 from .cache import BitCache
 
+###############################################################################
+## CONSTANTS
+###############################################################################
+_WORDS: Final[Dict[int, Struct]] = {
+    8: Struct(">B"),
+    16: Struct(">H"),
+    32: Struct(">I"),
+    64: Struct(">Q"),
+}
+
 
 ###############################################################################
 ## BASIC CACHE
@@ -45,17 +58,36 @@ class BasicCache(BitCache):
         Erases the cache.
     pop(n: int) -> str:
         Returns a size `n` bitstring removing it from the top of the cache.
+    pop_bytes(n: int) -> bytes:
+        Returns `n` bytes removing them from the top of the cache.
+    pop_uint(n: int) -> int:
+        Returns a size `n` unsigned int removing it from the top of the cache.
     push(bitstring: str) -> None:
         Inserts bitstring at the end of the cache.
+
+    Notes
+    -----
+    Bits are stored packed eight per byte (most significant bit first) in a
+    bytearray, together with the offset of the first valid bit inside the
+    leading byte. This takes an eighth of the memory of a character based
+    cache, and allows retrieving unsigned ints directly from the underlying
+    bytes (through precompiled structs for byte-aligned 8 to 64 bit words).
+
+    Pushes only touch the trailing (partial) byte and extend the bytearray,
+    while pops delete whole leading bytes; CPython implements the latter by
+    advancing the start of the buffer, so neither operation moves the rest of
+    the cache and both are amortized O(1) plus the cost of the bits involved.
     """
 
     def __init__(self) -> None:
-        self._cache: str = ""
+        self._cache: bytearray = bytearray()
+        self._offset: int = 0
+        self._size: int = 0
 
     ############################### PUBLIC API ###############################
     @property
     def size(self) -> int:
-        return len(self._cache)
+        return self._size
 
     @property
     def state(self) -> dict:
@@ -66,21 +98,83 @@ class BasicCache(BitCache):
         return {"size": self.size}
 
     def dump(self) -> str:
-        return self._cache
+        if not self._size:
+            return ""
+        end: int = self._offset + self._size
+        uint: int = int.from_bytes(self._cache, "big")
+        uint >>= len(self._cache) * 8 - end
+        uint &= (1 << self._size) - 1
+        return f"{uint:0{self._size}b}"
 
     def flush(self) -> None:
-        self._cache = ""
+        self._cache = bytearray()
+        self._offset = 0
+        self._size = 0
 
     def pop(self, num_bits: int) -> str:
-        validate_natural(num_bits, zero=False)
-        if num_bits > self.size:
-            raise RuntimeError(
-                f"Insufficient cache size {self.size} < {num_bits}."
-            )
-        bitstring: str = self._cache[:num_bits]
-        self._cache = self._cache[num_bits:]
-        return bitstring
+        uint: int = self.pop_uint(num_bits)
+        return f"{uint:0{num_bits}b}"
+
+    def pop_bytes(self, num_bytes: int) -> bytes:
+        if self._offset:
+            return super().pop_bytes(num_bytes)
+        num_bits: int = num_bytes * 8
+        if not (type(num_bytes) is int and 0 < num_bits <= self._size):
+            self._validate_pop(num_bytes, num_bits)
+        out: bytes = bytes(self._cache[:num_bytes])
+        del self._cache[:num_bytes]
+        self._size -= num_bits
+        if not self._size:
+            self.flush()
+        return out
+
+    def pop_uint(self, num_bits: int) -> int:
+        if not (type(num_bits) is int and 0 < num_bits <= self._size):
+            self._validate_pop(num_bits, num_bits)
+        end: int = self._offset + num_bits
+        word: Optional[Struct] = None if self._offset else _WORDS.get(num_bits)
+        uint: int
+        if word:
+            uint = word.unpack_from(self._cache)[0]
+        else:
+            num_bytes: int = (end + 7) // 8
+            uint = int.from_bytes(self._cache[:num_bytes], "big")
+            if self._offset or end % 8:
+                uint >>= num_bytes * 8 - end
+                uint &= (1 << num_bits) - 1
+        del self._cache[: end // 8]
+        self._offset = end % 8
+        self._size -= num_bits
+        if not self._size:
+            self.flush()
+        return uint
 
     def push(self, bitstring: str) -> None:
         validate_numeral(bitstring, ALPHABETS["BINARY"])
-        self._cache += bitstring
+        if not bitstring:
+            return
+        num_bits: int = len(bitstring)
+        uint: int = int(bitstring, base=2)
+        end: int = self._offset + self._size
+        trailing: int = end % 8
+        if trailing:
+            uint |= (self._cache.pop() >> (8 - trailing)) << num_bits
+            num_bits += trailing
+        padding: int = -num_bits % 8
+        self._cache += (uint << padding).to_bytes(
+            (num_bits + padding) // 8, "big"
+        )
+        self._size += len(bitstring)
+
+    ############################### PRIVATE API ###############################
+    def _validate_pop(self, num: int, num_bits: int) -> None:
+        """
+        Raises the documented pop exceptions for a request of `num` units
+        (bits or bytes) amounting to `num_bits` bits. Only reached when the
+        inline fast check in the pop methods fails.
+        """
+        validate_natural(num, zero=False)
+        if num_bits > self._size:
+            raise RuntimeError(
+                f"Insufficient cache size {self._size} < {num_bits}."
+            )
@@ -22,6 +22,8 @@
 
 from abc import ABC, abstractmethod
 
+from ..helpers import validate_natural
+
 
 ###############################################################################
 ## BIT CACHE INTERFACE
@@ -43,6 +45,10 @@ class BitCache(ABC):
         Erases the cache.
     pop(n: int) -> str:
         Returns a size `n` bitstring removing it from the top of the cache.
+    pop_bytes(n: int) -> bytes:
+        Returns `n` bytes removing them from the top of the cache.
+    pop_uint(n: int) -> int:
+        Returns a size `n` unsigned int removing it from the top of the cache.
     push(bitstring: str) -> None:
         Inserts bitstring at the end of the cache.
     """
@@ -101,6 +107,58 @@ class BitCache(ABC):
         """
         pass
 
+    def pop_bytes(self, num_bytes: int) -> bytes:
+        """
+        Returns `n` bytes removing them from the top of the cache.
+
+        Parameters
+        ----------
+        num_bytes: int
+            Number of bytes to retrieve.
+
+        Returns
+        -------
+        out: bytes
+            Bytes object built from the first `8 * num_bytes` bits in the
+            cache (most significant bit first).
+
+        Raises
+        ------
+        TypeError
+            If input is not int.
+        ValueError
+            If input is less than one.
+        RuntimeError
+            If input is greater than cache size.
+        """
+        validate_natural(num_bytes, zero=False)
+        return self.pop_uint(num_bytes * 8).to_bytes(num_bytes, "big")
+
+    def pop_uint(self, num_bits: int) -> int:
+        """
+        Returns a size `n` unsigned int removing it from the top of the cache.
+
+        Parameters
+        ----------
+        num_bits: int
+            Number of bits to retrieve.
+
+        Returns
+        -------
+        out: int
+            Unsigned int built from the first `num_bits` in the cache.
+
+        Raises
+        ------
+        TypeError
+            If input is not int.
+        ValueError
+            If input is less than one.
+        RuntimeError
+            If input is greater than cache size.
+        """
+        return int(self.pop(num_bits), base=2)
+
     @abstractmethod
     def push(self, bitstring: str) -> None:
         """
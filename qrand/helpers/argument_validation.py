@@ -74,11 +74,11 @@ def validate_type(
     TypeError
         If `object` does not match `classinfo`.
     """
-    MESSAGE = f"Invalid object type {type(object)}"
-    MESSAGE += (
-        f", expected {classinfo.__name__}."
-        if isinstance(classinfo, type)
-        else "."
-    )
     if not isinstance(object, classinfo):
+        MESSAGE = f"Invalid object type {type(object)}"
+        MESSAGE += (
+            f", expected {classinfo.__name__}."
+            if isinstance(classinfo, type)
+            else "."
+        )
         raise TypeError(MESSAGE)
@@ -21,7 +21,8 @@
 ## limitations under the License.
 
 from collections import OrderedDict
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 from .argument_validation import validate_natural, validate_type
 
@@ -29,6 +30,7 @@ _UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 _LOWER = "abcdefghijklmnopqrstuvwxyz"
 _NUMBERS = "0123456789"
 _SYMBOLS = "<>.,:;_-+*=?!|@#$%&/()"
+_MAX_PAIR_TABLE_BITS = 6  # Digit pair tables up to base64 (4096 entries)
 
 
 ###############################################################################
@@ -70,14 +72,14 @@ def encode_numeral(uint: int, base_alphabet: str) -> str:
     _validate_encode_args(uint, base_alphabet)
     base_alphabet = _remove_duplicate_chars(base_alphabet)
     base: int = len(base_alphabet)
-    remainder: int = uint % base
-    numeral: str = base_alphabet[remainder]
-    uint //= base
+    if base > 1 and not base & (base - 1):
+        return _encode_power_of_two(uint, base_alphabet)
+    uint, remainder = divmod(uint, base)
+    digits: List[str] = [base_alphabet[remainder]]
     while uint != 0:
-        remainder = uint % base
-        numeral += base_alphabet[remainder]
-        uint //= base
-    return reverse_endian(numeral)
+        uint, remainder = divmod(uint, base)
+        digits.append(base_alphabet[remainder])
+    return "".join(reversed(digits))
 
 
 ###############################################################################
@@ -161,6 +163,12 @@ def isnumeral(numeral: str, base_alphabet: str) -> bool:
     """
     validate_type(numeral, str)
     validate_type(base_alphabet, str)
+    if numeral.isascii() and base_alphabet.isascii():
+        # Only characters outside the alphabet survive deleting its bytes
+        leftover: bytes = numeral.encode().translate(
+            None, base_alphabet.encode()
+        )
+        return not leftover
     a: set = set(base_alphabet)
     n: set = set(numeral)
     return n.issubset(a)
@@ -206,6 +214,34 @@ def _build_value_dict(base_alphabet: str) -> Dict[str, int]:
     return dictionary
 
 
+def _encode_power_of_two(uint: int, base_alphabet: str) -> str:
+    # Every digit is a fixed-width slice of the binary representation, so
+    # digits are sliced off with bit shifts; up to base64 they are emitted
+    # two at a time from a digit pair table
+    k: int = len(base_alphabet).bit_length() - 1
+    shift: int = -(-uint.bit_length() // k) * k or k
+    if k > _MAX_PAIR_TABLE_BITS:
+        mask: int = (1 << k) - 1
+        return "".join(
+            base_alphabet[(uint >> s) & mask] for s in range(shift - k, -1, -k)
+        )
+    pairs: Tuple[str, ...] = _digit_pairs(base_alphabet)
+    mask = (1 << 2 * k) - 1
+    chars: List[str] = []
+    if shift % (2 * k):
+        shift -= k
+        chars.append(base_alphabet[uint >> shift])
+    while shift:
+        shift -= 2 * k
+        chars.append(pairs[(uint >> shift) & mask])
+    return "".join(chars)
+
+
+@lru_cache(maxsize=16)
+def _digit_pairs(base_alphabet: str) -> Tuple[str, ...]:
+    return tuple(a + b for a in base_alphabet for b in base_alphabet)
+
+
 def _remove_duplicate_chars(base_alphabet: str) -> str:
     od: Dict[str, Any] = OrderedDict.fromkeys(base_alphabet)
     return "".join(od)
@@ -43,11 +43,19 @@ class QuantumCircuit(ABC):
     def measure(self, target_qubit: int) -> None:
         pass
 
+    def measure_all_qubits(self) -> None:
+        for q in range(self.num_qubits):
+            self.measure(q)
+
     ########################### SINGLE QUBIT GATES ###########################
     @abstractmethod
     def h(self, target_qubit: int) -> None:
         pass
 
+    def h_all(self) -> None:
+        for q in range(self.num_qubits):
+            self.h(q)
+
     @abstractmethod
     def rx(self, radians: float, target_qubit: int) -> None:
         pass
@@ -38,11 +38,12 @@ class QiskitBackend(QuantumBackend, Backend):
             backend.configuration(), backend.provider()
         )
         self._options: Options = backend._options
+        self._configuration_dict: dict = self.configuration().to_dict()
 
     ############################### PUBLIC API ###############################
     @property
     def configuration_dict(self) -> dict:
-        return self.configuration().to_dict()
+        return self._configuration_dict
 
     @property
     def max_experiments(self) -> int:
@@ -40,10 +40,17 @@ class QiskitCircuit(QuantumCircuit, QiskitQuantumCircuit):
     def measure(self, target_qubit: int) -> None:
         super(QuantumCircuit, self).measure(target_qubit, target_qubit)
 
+    def measure_all_qubits(self) -> None:
+        qubits: range = range(self.num_qubits)
+        super(QuantumCircuit, self).measure(qubits, qubits)
+
     ########################### SINGLE QUBIT GATES ###########################
     def h(self, target_qubit: int) -> None:
         super(QuantumCircuit, self).h(target_qubit)
 
+    def h_all(self) -> None:
+        super(QuantumCircuit, self).h(range(self.num_qubits))
+
     def rx(self, radians: float, target_qubit: int) -> None:
         super(QuantumCircuit, self).rx(radians, target_qubit)
 
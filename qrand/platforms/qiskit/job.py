@@ -24,15 +24,12 @@ from typing import List, Optional
 from warnings import warn
 
 from qiskit import QuantumCircuit as QiskitQuantumCircuit
-from qiskit import execute
+from qiskit import execute, transpile
 from qiskit.providers import Job
 from qiskit.result import Counts, Result
+from qiskit.transpiler import PassManager
 
-from ...helpers import (
-    compute_bounded_factorization,
-    reverse_endian,
-    validate_type,
-)
+from ...helpers import compute_bounded_factorization, validate_type
 from ..job import QuantumJob
 from .backend import QiskitBackend
 from .circuit import QiskitCircuit
@@ -104,14 +101,13 @@ class QiskitJob(QuantumJob):
         )
 
     def execute(self) -> List[str]:
-        circuits: List[QiskitQuantumCircuit] = [
-            self.circuit
-        ] * self._experiments
+        circuit: QiskitQuantumCircuit = transpile(self.circuit, self.backend)
         self._base_job = execute(
-            circuits,
+            [circuit] * self._experiments,
             self.backend,
             shots=self._shots,
             memory=self._requires_memory,
+            pass_manager=PassManager(),  # Already transpiled
         )
         result: Result = self._base_job.result()
         return self._parse_result(result)
@@ -147,13 +143,12 @@ class QiskitJob(QuantumJob):
         )
 
     def _parse_result(self, result: Result) -> List[str]:
-        measurements: List[str] = []
         if self._requires_memory:
-            for e in range(self._experiments):
-                measurements += result.get_memory(e)
-        else:
-            cts = result.get_counts()
-            counts: List[Counts] = [cts] if isinstance(cts, list) else cts
-            for c in counts:
-                measurements += [k for k, v in c.items() if v == 1]
-        return [reverse_endian(m) for m in measurements]
+            return [
+                m[::-1]
+                for e in range(self._experiments)
+                for m in result.get_memory(e)
+            ]
+        cts = result.get_counts()
+        counts: List[Counts] = cts if isinstance(cts, list) else [cts]
+        return [k[::-1] for c in counts for k, v in c.items() if v == 1]
@@ -20,6 +20,7 @@
 ## See the License for the specific language governing permissions and
 ## limitations under the License.
 
+from time import monotonic
 from typing import Callable, List, Optional
 
 from qiskit import BasicAer
@@ -50,7 +51,9 @@ class QiskitPlatform(QuantumPlatform):
         provider: Optional[Provider] = None,
         backend: Optional[Backend] = None,
         backend_filter: Optional[BackendFilter] = None,
+        backend_ttl: float = 30.0,
     ) -> None:
+        self._backend_expiry: float = 0.0
         if backend:
             provider = None
         elif provider:
@@ -63,6 +66,8 @@ class QiskitPlatform(QuantumPlatform):
         self.provider: Optional[Provider] = provider
         self.backend: Backend = backend
         self.backend_filter: Optional[BackendFilter] = backend_filter
+        self.backend_ttl: float = backend_ttl
+        self._backend_expiry = monotonic() + self.backend_ttl
 
     ############################### PUBLIC API ###############################
     @property
@@ -74,6 +79,22 @@ class QiskitPlatform(QuantumPlatform):
         validate_type(backend, Backend)
         self._backend: Backend = backend
 
+    @property
+    def backend_ttl(self) -> float:
+        """
+        Seconds during which the backend chosen from the provider is reused
+        before querying the provider again for the least busy one.
+        """
+        return self._backend_ttl
+
+    @backend_ttl.setter
+    def backend_ttl(self, backend_ttl: float) -> None:
+        validate_type(backend_ttl, (int, float))
+        if backend_ttl < 0:
+            raise ValueError(f"Invalid negative backend TTL: {backend_ttl}.")
+        self._backend_ttl: float = float(backend_ttl)
+        self._backend_expiry = 0.0
+
     @property
     def backend_filter(self) -> Optional[BackendFilter]:
         return self._backend_filter or self.default_backend_filter
@@ -86,6 +107,7 @@ class QiskitPlatform(QuantumPlatform):
             self._backend_filter: Optional[BackendFilter] = backend_filter
         except Exception:
             self._backend_filter = None
+        self._backend_expiry = 0.0
 
     @property
     def provider(self) -> Optional[Provider]:
@@ -95,6 +117,7 @@ class QiskitPlatform(QuantumPlatform):
     def provider(self, provider: Optional[Provider]) -> None:
         validate_type(provider, (Provider, type(None)))
         self._provider: Provider = provider
+        self._backend_expiry = 0.0
 
     @staticmethod
     def default_backend_filter(b: Backend) -> bool:
@@ -118,11 +141,13 @@ class QiskitPlatform(QuantumPlatform):
         return result.bitstring
 
     def retrieve_backend(self) -> QiskitBackend:
-        if self.provider:
+        now: float = monotonic()
+        if self.provider and now >= self._backend_expiry:
             self.backend = self._get_best_backend(
                 provider=self.provider,
                 backend_filter=self.backend_filter,
             )
+            self._backend_expiry = now + self.backend_ttl
         return QiskitBackend(self.backend)
 
     ############################### PRIVATE API ###############################
@@ -22,6 +22,8 @@
 
 from typing import List, Literal, Optional, Tuple
 
+from numpy import ascontiguousarray, frombuffer, ndarray, uint8
+
 from ..helpers import (
     ALPHABETS,
     validate_natural,
@@ -137,25 +139,19 @@ class EntanglementProtocol(BareQuantumProtocol):
             circuit.measure(q)
         circuit.measure(0)
 
-    @staticmethod
-    def _check_even_parity(measurement: str) -> bool:
-        return measurement.count("1") % 2 == 0
-
     def _parse_measurements(self, measurements: List[str]) -> BasicResult:
         validate_type(measurements, list)
-        num_bits = len(measurements[0])
-        bit_sequences: List[str] = [""] * num_bits
-        for m in measurements:
-            validate_numeral(m, ALPHABETS["BINARY"])
-            if self.purify and not self._check_even_parity(m):
-                continue
-            for b in range(num_bits):
-                bit_sequences[b] += m[b]
-        bitstring: str = ""
-        validation_token: str = bit_sequences.pop(0)
-        _ = bit_sequences.pop()
-        for s in bit_sequences:
-            bitstring += s
+        num_bits: int = len(measurements[0])
+        joined: str = "".join(measurements)
+        validate_numeral(joined, ALPHABETS["BINARY"])
+        # One row per measurement (ASCII codes), one column per qubit
+        table: ndarray = frombuffer(joined.encode(), dtype=uint8)
+        table = table.reshape(-1, num_bits)
+        if self.purify:
+            table = table[(table - ord("0")).sum(axis=1) % 2 == 0]
+        bit_sequences: ndarray = ascontiguousarray(table.T)
+        validation_token: str = bit_sequences[0].tobytes().decode()
+        bitstring: str = bit_sequences[1:-1].tobytes().decode()
         return BasicResult(bitstring, validation_token)
 
     def _partition_job(self, backend: QuantumBackend) -> Tuple[int, int]:
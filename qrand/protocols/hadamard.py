@@ -100,16 +100,13 @@ class HadamardProtocol(BareQuantumProtocol):
     @staticmethod
     def _assemble_quantum_circuit(circuit: QuantumCircuit) -> None:
         validate_type(circuit, QuantumCircuit)
-        for q in range(circuit.num_qubits):
-            circuit.h(q)
-            circuit.measure(q)
+        circuit.h_all()
+        circuit.measure_all_qubits()
 
     def _parse_measurements(self, measurements: List[str]) -> BasicResult:
         validate_type(measurements, list)
-        bitstring: str = ""
-        for m in measurements:
-            validate_numeral(m, ALPHABETS["BINARY"])
-            bitstring += m
+        bitstring: str = "".join(measurements)
+        validate_numeral(bitstring, ALPHABETS["BINARY"])
         return BasicResult(bitstring)
 
     def _partition_job(self, backend: QuantumBackend) -> Tuple[int, int]:
@@ -20,14 +20,49 @@
 ## See the License for the specific language governing permissions and
 ## limitations under the License.
 
+import cmath
 import math
-from struct import pack, unpack
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, Final, List, Optional, Tuple, Union
+
+from numpy import (
+    complex128,
+    cos,
+    empty,
+    flatnonzero,
+    frombuffer,
+    full,
+    int64,
+    ndarray,
+    packbits,
+    prod,
+    sin,
+    sqrt,
+    uint8,
+    uint64,
+    unpackbits,
+    zeros,
+)
+from numpy.random import Generator
 
 from .errors import raise_future_warning
-from .helpers import ALPHABETS, encode_numeral, validate_type
+from .helpers import ALPHABETS, encode_numeral, validate_natural, validate_type
 from .quantum_bit_generator import QuantumBitGenerator
 
+###############################################################################
+## CUSTOM TYPES
+###############################################################################
+Size = Optional[Union[int, Tuple[int, ...]]]
+
+
+###############################################################################
+## CONSTANTS
+###############################################################################
+_FP32_ULP: Final[float] = 2.0**-23  # Unit in the last place of 1.0 (FP32)
+_FP64_ULP: Final[float] = 2.0**-52  # Unit in the last place of 1.0 (FP64)
+_BASE32: Final[str] = ALPHABETS["BASE32"]
+_BASE64: Final[str] = ALPHABETS["BASE64"]
+
 
 ###############################################################################
 ## QRNG (OBJECT WRAPPER)
@@ -62,11 +97,16 @@ class Qrng:
         uniform distribution.
     get_random_bitstring(num_bits: Optional[int] = None) -> str:
         Returns a random bitstring from a `num_bits` uniform distribution.
+    get_random_bitstrings(
+        num_strings: int, num_bits: Optional[int] = None
+    ) -> List[str]:
+        Returns a list of `num_strings` random bitstrings from a `num_bits`
+        uniform distribution.
     get_random_bytes(num_bytes: Optional[int] = None) -> bytes:
         Returns a bytes object from a `num_bytes` uniform distribution.
     get_random_complex_polar(
-        r: float = 1, theta: float = 2 * math.pi
-    ) -> complex:
+        r: float = 1, theta: float = 2 * math.pi, size: Size = None
+    ) -> Union[complex, ndarray]:
         Returns a random complex in rectangular form from a given polar range.
         If no max radius give, 1 is used. If no max angle given, 2pi used.
     get_random_complex_rect(
@@ -74,37 +114,69 @@ class Qrng:
         r2: float = +1,
         i1: Optional[float] = None,
         i2: Optional[float] = None,
-    ) -> complex:
+        size: Size = None,
+    ) -> Union[complex, ndarray]:
         Returns a random complex with both real and imaginary parts from the
         given ranges. Default real range [-1,1). If no imaginary range
         specified, real range used.
     get_random_decimal(num_bits: Optional[int] = None) -> str:
         Returns a random decimal base encoded numeral string from a `num_bits`
         uniform distribution.
-    get_random_double(min: float = -1, max: float = +1) -> float:
+    get_random_double(
+        min: float = -1, max: float = +1, size: Size = None
+    ) -> Union[float, ndarray]:
         Returns a random double from a uniform distribution in the range
         [min,max). Default range [-1,1).
-    get_random_float(min: float = -1, max: float = +1) -> float:
+    get_random_double_array(
+        size: int, min: float = -1, max: float = +1
+    ) -> ndarray:
+        Returns an array of `size` random doubles from a uniform distribution
+        in the range [min,max). Default range [-1,1).
+    get_random_float(
+        min: float = -1, max: float = +1, size: Size = None
+    ) -> Union[float, ndarray]:
         Returns a random float from a uniform distribution in the range
         [min,max). Default range [-1,1).
     get_random_hex(num_bits: Optional[int] = None) -> str:
         Returns a random hex base encoded numeral string from a `num_bits`
         uniform distribution.
-    get_random_int(min: int = -1, max: int = +1) -> int:
+    get_random_int(
+        min: int = -1, max: int = +1, size: Size = None
+    ) -> Union[int, ndarray]:
         Returns a random integer between and including [min, max]. Default
         range [-1,1].
     get_random_int32() -> int:
         Returns a random 32 bit unsigned integer from a uniform distribution.
     get_random_int64() -> int:
         Returns a random 64 bit unsigned integer from a uniform distribution.
+    get_random_int64_array(size: int) -> ndarray:
+        Returns an array of `size` random 64 bit unsigned integers from a
+        uniform distribution.
+    get_random_normal(
+        mu: float = 0, sigma: float = 1, size: Size = None
+    ) -> Union[float, ndarray]:
+        Returns a random double from a normal (Gaussian) distribution of mean
+        `mu` and standard deviation `sigma`. Default standard normal.
     get_random_octal(num_bits: Optional[int] = None) -> str:
         Returns a random octal base encoded numeral string from a `num_bits`
         uniform distribution.
+    get_random_string(
+        num_bits: Optional[int] = None, alphabet: str = ALPHABETS["DEFAULT"]
+    ) -> str:
+        Returns a random fixed-length string over `alphabet` with at least
+        `num_bits` of entropy.
     get_random_uint(num_bits: Optional[int] = None) -> int:
         Returns a random unsigned int from a `num_bits` uniform distribution.
 
     Notes
     -----
+    Methods accepting a `size` argument return a single value if `size` is
+    `None`, and a NumPy ndarray of the given shape otherwise. Arrays are
+    built from a single block of cached bits, converted with NumPy, and hold
+    the same values as consecutive single draws, except for
+    `get_random_int` (see its notes) and up to rounding for
+    `get_random_complex_polar`.
+
     COPYRIGHT ACKNOWLEDGEMENT
     Source: https://github.com/ozaner/qRNG/tree/v1.0.0
     License: GNU GENERAL PUBLIC LICENSE VERSION 3
@@ -142,6 +214,12 @@ class Qrng:
         self._quantum_bit_generator: QuantumBitGenerator = (
             quantum_bit_generator
         )
+        self._BITS: int = quantum_bit_generator.BITS
+        self._random_bitstring = quantum_bit_generator.random_bitstring
+        self._random_bytes = quantum_bit_generator.random_bytes
+        self._random_double = quantum_bit_generator.random_double
+        self._random_uint = quantum_bit_generator.random_uint
+        self._generator: Generator = Generator(quantum_bit_generator)
 
     @property
     def state(self) -> dict:
@@ -168,7 +246,7 @@ class Qrng:
             Random bitstring of length `num_bits`.
         """
         raise_future_warning("get_bit_string", "1.0.0", "get_random_bitstring")
-        return self.quantum_bit_generator.random_bitstring(num_bits)
+        return self._quantum_bit_generator.random_bitstring(num_bits)
 
     def get_random_base32(self, num_bits: Optional[int] = None) -> str:
         """
@@ -185,8 +263,8 @@ class Qrng:
         out: str
             Random base32 encoded numeral string.
         """
-        uint: int = self.get_random_uint(num_bits)
-        return encode_numeral(uint, ALPHABETS["BASE32"])
+        uint: int = self._random_uint(num_bits)
+        return encode_numeral(uint, _BASE32)
 
     def get_random_base64(self, num_bits: Optional[int] = None) -> str:
         """
@@ -203,8 +281,8 @@ class Qrng:
         out: str
             Random base64 encoded numeral string.
         """
-        uint: int = self.get_random_uint(num_bits)
-        return encode_numeral(uint, ALPHABETS["BASE64"])
+        uint: int = self._random_uint(num_bits)
+        return encode_numeral(uint, _BASE64)
 
     def get_random_bitstring(self, num_bits: Optional[int] = None) -> str:
         """
@@ -220,7 +298,46 @@ class Qrng:
         out: str
             Random bitstring of length `num_bits`.
         """
-        return self.quantum_bit_generator.random_bitstring(num_bits)
+        return self._random_bitstring(num_bits)
+
+    def get_random_bitstrings(
+        self, num_strings: int, num_bits: Optional[int] = None
+    ) -> List[str]:
+        """
+        Returns a list of `num_strings` random bitstrings from a `num_bits`
+        uniform distribution.
+
+        Parameters
+        ----------
+        num_strings: int
+            Number of bitstrings to produce.
+        num_bits: int, default: BITS (i.e. 32 or 64)
+            Number of bits in each bitstring.
+
+        Returns
+        -------
+        out: List[str]
+            List of `num_strings` random bitstrings of length `num_bits`.
+
+        Notes
+        -----
+        All bits are drawn from the cache at once and then sliced, which is
+        equivalent to (but faster than) calling `get_random_bitstring()`
+        `num_strings` times.
+        """
+        validate_natural(num_strings, zero=True)
+        num_bits = (
+            num_bits
+            if isinstance(num_bits, int) and num_bits > 0
+            else self._BITS
+        )
+        if not num_strings:
+            return []
+        bitstring: str = self._random_bitstring(num_strings * num_bits)
+        return [
+            bitstring[i : i + num_bits]
+            for i in range(0, num_strings * num_bits, num_bits)
+        ]
 
     def get_random_bytes(self, num_bytes: Optional[int] = None) -> bytes:
         """
@@ -236,18 +353,11 @@ class Qrng:
         out: bytes
             Random bytes object of size `num_bytes`.
         """
-        num_bits: int = (
-            num_bytes * 8
-            if num_bytes and type(num_bytes) is int and num_bytes > 0
-            else self.quantum_bit_generator.BITS
-        )
-        num_bytes = num_bits // 8
-        uint: int = self.quantum_bit_generator.random_uint(num_bits)
-        return uint.to_bytes(num_bytes, "big")
+        return self._random_bytes(num_bytes)
 
     def get_random_complex_polar(
-        self, r: float = 1, theta: float = 2 * math.pi
-    ) -> complex:
+        self, r: float = 1, theta: float = 2 * math.pi, size: Size = None
+    ) -> Union[complex, ndarray]:
         """
         Returns a random complex in rectangular form from a given polar range.
         If no max radius give, 1 is used. If no max angle given, 2pi used.
@@ -258,15 +368,26 @@ class Qrng:
             Real lower bound for the random number.
         theta: float, default 2pi
             Real strict upper bound for the random number.
+        size: int or Tuple[int, ...], default None
+            Output shape. If `None` a single value is returned.
 
         Returns
         -------
-        out: complex
+        out: complex or ndarray
             Random complex in the range [0,r) * exp{ j[0,theta) }.
         """
-        r0: float = r * math.sqrt(self.get_random_double(0, 1))
-        theta0: float = self.get_random_double(0, theta)
-        return r0 * math.cos(theta0) + r0 * math.sin(theta0) * 1j
+        if size is not None:
+            count: int = int(prod(size))
+            pairs: ndarray = self._random_uint_array(52, 2 * count)
+            standard_values: ndarray = pairs.reshape(count, 2) * _FP64_ULP
+            radii: ndarray = r * sqrt(standard_values[:, 0])
+            angles: ndarray = theta * standard_values[:, 1]
+            out: ndarray = empty(count, dtype=complex128)
+            out.real = radii * cos(angles)
+            out.imag = radii * sin(angles)
+            return out.reshape(size)
+        r0: float = r * math.sqrt(self._random_double())
+        return cmath.rect(r0, self._random_double(theta))
 
     def get_random_complex_rect(
         self,
@@ -274,7 +395,8 @@ class Qrng:
         r2: float = +1,
         i1: Optional[float] = None,
         i2: Optional[float] = None,
-    ) -> complex:
+        size: Size = None,
+    ) -> Union[complex, ndarray]:
         """
         Returns a random complex with both real and imaginary parts from the
         given ranges. Default real range [-1,1). If no imaginary range
@@ -290,18 +412,28 @@ class Qrng:
             Imaginary lower bound for the random number.
         i2: float, default None
             Imaginary strict upper bound for the random number.
+        size: int or Tuple[int, ...], default None
+            Output shape. If `None` a single value is returned.
 
         Returns
         -------
-        out: complex
+        out: complex or ndarray
             Random complex in the range [r1,r2) + j[i1,i2).
         """
-        re: float = self.get_random_double(r1, r2)
         if i1 is None or i2 is None:
-            im: float = self.get_random_double(r1, r2)
-        else:
-            im = self.get_random_double(i1, i2)
-        return re + im * 1j
+            i1, i2 = r1, r2
+        r1, r2, i1, i2 = float(r1), float(r2), float(i1), float(i2)
+        if size is not None:
+            count: int = int(prod(size))
+            pairs: ndarray = self._random_uint_array(52, 2 * count)
+            standard_values: ndarray = pairs.reshape(count, 2) * _FP64_ULP
+            out: ndarray = empty(count, dtype=complex128)
+            out.real = (r2 - r1) * standard_values[:, 0] + r1
+            out.imag = (i2 - i1) * standard_values[:, 1] + i1
+            return out.reshape(size)
+        re: float = self._random_double(r2 - r1) + r1
+        im: float = self._random_double(i2 - i1) + i1
+        return complex(re, im)
 
     def get_random_decimal(self, num_bits: Optional[int] = None) -> str:
         """
@@ -318,10 +450,12 @@ class Qrng:
         out: str
             Random decimal base encoded numeral string.
         """
-        uint: int = self.quantum_bit_generator.random_uint(num_bits)
+        uint: int = self._random_uint(num_bits)
         return f"{uint:d}"
 
-    def get_random_double(self, min: float = -1, max: float = +1) -> float:
+    def get_random_double(
+        self, min: float = -1, max: float = +1, size: Size = None
+    ) -> Union[float, ndarray]:
         """
         Returns a random double from a uniform distribution in the range
         [min,max). Default range [-1,1).
@@ -332,18 +466,55 @@ class Qrng:
             Lower bound for the random number.
         max: float, default +1
             Strict upper bound for the random number.
+        size: int or Tuple[int, ...], default None
+            Output shape. If `None` a single value is returned.
 
         Returns
         -------
-        out: float
+        out: float or ndarray
             Random float in the range [min,max).
         """
-        min, max = float(min), float(max)
+        if type(min) is not float:
+            min = float(min)
+        if type(max) is not float:
+            max = float(max)
+        if size is not None:
+            return self._random_double_array(min, max, size)
         delta: float = max - min
-        shifted: float = self.quantum_bit_generator.random_double(delta)
+        shifted: float = self._random_double(delta)
         return shifted + min
 
-    def get_random_float(self, min: float = -1, max: float = +1) -> float:
+    def get_random_double_array(
+        self, size: int, min: float = -1, max: float = +1
+    ) -> ndarray:
+        """
+        Returns an array of `size` random doubles from a uniform distribution
+        in the range [min,max). Default range [-1,1).
+
+        Parameters
+        ----------
+        size: int
+            Number of random doubles to produce.
+        min: float, default -1
+            Lower bound for the random numbers.
+        max: float, default +1
+            Strict upper bound for the random numbers.
+
+        Returns
+        -------
+        out: ndarray
+            Array of `size` random doubles (float64).
+
+        Notes
+        -----
+        Equivalent to `get_random_double(min, max, size)`, kept for
+        convenience.
+        """
+        return self._random_double_array(float(min), float(max), size)
+
+    def get_random_float(
+        self, min: float = -1, max: float = +1, size: Size = None
+    ) -> Union[float, ndarray]:
         """
         Returns a random float from a uniform distribution in the range
         [min,max). Default range [-1,1).
@@ -354,16 +525,21 @@ class Qrng:
             Lower bound for the random number.
         max: float, default +1
             Strict upper bound for the random number.
+        size: int or Tuple[int, ...], default None
+            Output shape. If `None` a single value is returned.
 
         Returns
         -------
-        out: float
+        out: float or ndarray
             Random float in the range [min,max).
 
         Notes
         -----
         Implementation based on the single-precision floating-point format
-        (FP32) [1]_.
+        (FP32) [1]_: 23 random bits are taken as the mantissa of a float in
+        [1,2), and one is subtracted. Since the result is exactly the
+        mantissa scaled by 2^-23, it is computed as such without packing the
+        bits into an actual FP32 binary representation.
 
         References
         ----------
@@ -372,12 +548,15 @@ class Qrng:
             w/index.php?title=Single-precision_floating-
             point_format&oldid=1024960263 (accessed May 25, 2021).
         """
-        min, max = float(min), float(max)
-        bits_as_uint: int = (
-            0x3F800000 | self.quantum_bit_generator.random_uint(32 - 9)
-        )
-        to_bytes: bytes = pack(">I", bits_as_uint)
-        standard_value: float = unpack(">f", to_bytes)[0] - 1.0
+        if type(min) is not float:
+            min = float(min)
+        if type(max) is not float:
+            max = float(max)
+        if size is not None:
+            uints: ndarray = self._random_uint_array(23, int(prod(size)))
+            standard_values: ndarray = uints.reshape(size) * _FP32_ULP
+            return (max - min) * standard_values + min
+        standard_value: float = self._random_uint(23) * _FP32_ULP
         return (max - min) * standard_value + min
 
     def get_random_hex(self, num_bits: Optional[int] = None) -> str:
@@ -395,10 +574,12 @@ class Qrng:
         out: str
             Random hex base encoded numeral string.
         """
-        uint: int = self.quantum_bit_generator.random_uint(num_bits)
+        uint: int = self._random_uint(num_bits)
         return f"{uint:X}"
 
-    def get_random_int(self, min: int = -1, max: int = +1) -> int:
+    def get_random_int(
+        self, min: int = -1, max: int = +1, size: Size = None
+    ) -> Union[int, ndarray]:
         """
         Returns a random integer between and including [min, max]. Default
         range [-1,1].
@@ -409,18 +590,51 @@ class Qrng:
             Lower bound for the random int.
         max: int, default +1
             Upper bound for the random int.
+        size: int or Tuple[int, ...], default None
+            Output shape. If `None` a single value is returned.
 
         Returns
         -------
-        out: int
+        out: int or ndarray
             Random int in the range [min,max].
+
+        Raises
+        ------
+        ValueError
+            If `max` is less than `min`.
+
+        Notes
+        -----
+        Uses Lemire's multiply-and-reject method [1]_: a random uint `x` of
+        the range's bit length is mapped to `x * span`, whose high bits are
+        the result. The draw size and rejection threshold, which requires a
+        modulo, are cached per range, so repeated calls take no division at
+        all. Arrays within int64 are instead drawn in bulk and redrawn where
+        above the range (see `_random_int64_array`).
+
+        References
+        ----------
+        .. [1] Lemire, D. (2019) Fast Random Integer Generation in an
+            Interval. ACM Transactions on Modeling and Computer Simulation,
+            29(1), 1-12. https://doi.org/10.1145/3230636
         """
         delta: int = max - min
-        num_bits: int = math.floor(math.log(delta, 2)) + 1
-        shifted: int = self.quantum_bit_generator.random_uint(num_bits)
-        while shifted > delta:
-            shifted = self.quantum_bit_generator.random_uint(num_bits)
-        return shifted + min
+        if delta < 0:
+            raise ValueError(f"Invalid range [{min}, {max}].")
+        if size is not None:
+            if -(2**63) <= min and max < 2**63:
+                return self._random_int64_array(min, delta, size)
+            return self._fill_array(
+                lambda: self.get_random_int(min, max), size, object
+            )
+        if delta == 0:
+            return min
+        span: int = delta + 1
+        num_bits, mask, threshold = self._lemire_params(span)
+        product: int = self._random_uint(num_bits) * span
+        while product & mask < threshold:
+            product = self._random_uint(num_bits) * span
+        return (product >> num_bits) + min
 
     def get_random_int32(self) -> int:
         """
@@ -431,7 +645,7 @@ class Qrng:
         out: int
             Random 32 bit unsigned int.
         """
-        return self.quantum_bit_generator.random_uint(32)
+        return self._random_uint(32)
 
     def get_random_int64(self) -> int:
         """
@@ -442,7 +656,59 @@ class Qrng:
         out: int
             Random 64 bit unsigned int.
         """
-        return self.quantum_bit_generator.random_uint(64)
+        return self._random_uint(64)
+
+    def get_random_int64_array(self, size: int) -> ndarray:
+        """
+        Returns an array of `size` random 64 bit unsigned integers from a
+        uniform distribution.
+
+        Parameters
+        ----------
+        size: int
+            Number of random ints to produce.
+
+        Returns
+        -------
+        out: ndarray
+            Array of `size` random 64 bit unsigned ints (uint64).
+        """
+        return self._quantum_bit_generator.random_raw_array(size, uint64)
+
+    def get_random_normal(
+        self, mu: float = 0, sigma: float = 1, size: Size = None
+    ) -> Union[float, ndarray]:
+        """
+        Returns a random double from a normal (Gaussian) distribution of mean
+        `mu` and standard deviation `sigma`. Default standard normal.
+
+        Parameters
+        ----------
+        mu: float, default 0
+            Mean of the distribution.
+        sigma: float, default 1
+            Standard deviation of the distribution. Must be non-negative.
+        size: int or Tuple[int, ...], default None
+            Output shape. If `None` a single value is returned.
+
+        Returns
+        -------
+        out: float or ndarray
+            Random normally distributed double(s).
+
+        Notes
+        -----
+        Samples are produced by NumPy's Generator on top of the quantum bit
+        generator, which implements the Ziggurat method [1]_ with precomputed
+        tables: in most cases, a single 64 bit random draw per sample.
+
+        References
+        ----------
+        .. [1] Marsaglia, G. and Tsang, W. W. (2000) The Ziggurat Method for
+            Generating Random Variables. Journal of Statistical Software, 5(8),
+            1-7. https://doi.org/10.18637/jss.v005.i08
+        """
+        return self._generator.normal(mu, sigma, size)
 
     def get_random_octal(self, num_bits: Optional[int] = None) -> str:
         """
@@ -459,9 +725,63 @@ class Qrng:
         out: str
             Random octal base encoded numeral string.
         """
-        uint: int = self.quantum_bit_generator.random_uint(num_bits)
+        uint: int = self._random_uint(num_bits)
         return f"{uint:o}"
 
+    def get_random_string(
+        self,
+        num_bits: Optional[int] = None,
+        alphabet: str = ALPHABETS["DEFAULT"],
+    ) -> str:
+        """
+        Returns a random fixed-length string over `alphabet` with at least
+        `num_bits` of entropy.
+
+        Parameters
+        ----------
+        num_bits: int, default: BITS (i.e. 32 or 64)
+            Minimum entropy of the output in bits.
+        alphabet: str, default: `qrand.helpers.ALPHABETS['DEFAULT']`
+            A string containig the alphabet to draw characters from.
+
+        Returns
+        -------
+        out: str
+            Random string of the shortest length `L` such that
+            `len(alphabet)**L >= 2**num_bits`, with repeated characters in
+            `alphabet` counted once.
+
+        Raises
+        ------
+        ValueError
+            If `alphabet` has less than two distinct characters.
+
+        Notes
+        -----
+        All characters are sampled together as the digits of a single uniform
+        integer below `len(alphabet)**L` (see `_sample_digits`), so no
+        entropy is wasted on non power of two alphabets.
+        """
+        validate_type(alphabet, str)
+        alphabet = "".join(dict.fromkeys(alphabet))  # Remove duplicate chars
+        base: int = len(alphabet)
+        if base < 2:
+            raise ValueError(f"Invalid alphabet length {base} < 2.")
+        num_bits = (
+            num_bits
+            if isinstance(num_bits, int) and num_bits > 0
+            else self._BITS
+        )
+        # Float estimate, corrected exactly with integer powers
+        threshold: int = 1 << num_bits
+        length: int = math.ceil(num_bits / math.log2(base))
+        while base ** (length - 1) >= threshold:
+            length -= 1
+        while base**length < threshold:
+            length += 1
+        digits: List[int] = self._sample_digits([base] * length)
+        return "".join(alphabet[d] for d in reversed(digits))
+
     def get_random_uint(self, num_bits: Optional[int] = None) -> int:
         """
         Returns a random unsigned int from a `num_bits` uniform distribution.
@@ -476,4 +796,103 @@ class Qrng:
         out: int
             Random unsigned int of size `num_bits`.
         """
-        return self.quantum_bit_generator.random_uint(num_bits)
+        return self._random_uint(num_bits)
+
+    ############################### PRIVATE API ###############################
+    @staticmethod
+    def _fill_array(
+        sampler: Callable[[], Any],
+        size: Union[int, Tuple[int, ...]],
+        dtype: Any,
+    ) -> ndarray:
+        """
+        Returns a new ndarray of shape `size` and type `dtype` filled with
+        successive outputs from `sampler`.
+        """
+        out: ndarray = empty(size, dtype=dtype)
+        flat: ndarray = out.reshape(-1)
+        for i in range(flat.size):
+            flat[i] = sampler()
+        return out
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _lemire_params(span: int) -> Tuple[int, int, int]:
+        """
+        Returns the draw size in bits, low bits mask, and rejection threshold
+        of Lemire's method for `span` (i.e. >= 2) possible outcomes.
+        """
+        num_bits: int = (span - 1).bit_length()
+        return num_bits, (1 << num_bits) - 1, (1 << num_bits) % span
+
+    def _random_double_array(
+        self, min: float, max: float, size: Union[int, Tuple[int, ...]]
+    ) -> ndarray:
+        """
+        Returns a new float64 ndarray of shape `size` filled with random
+        doubles in the range [min,max), built as in `get_random_double`.
+        """
+        uints: ndarray = self._random_uint_array(52, int(prod(size)))
+        standard_values: ndarray = uints.reshape(size) * _FP64_ULP
+        return (max - min) * standard_values + min
+
+    def _random_int64_array(
+        self, min: int, delta: int, size: Union[int, Tuple[int, ...]]
+    ) -> ndarray:
+        """
+        Returns a new int64 ndarray of shape `size` filled with random ints in
+        the range [min, min + delta], both within int64.
+
+        Values are drawn in bulk as uints of `delta.bit_length()` bits, and
+        those above `delta` are redrawn (i.e. with probability under one half)
+        until none remain.
+        """
+        count: int = int(prod(size))
+        if not delta:
+            return full(size, min, dtype=int64)
+        num_bits: int = delta.bit_length()
+        out: ndarray = self._random_uint_array(num_bits, count)
+        rejected: ndarray = flatnonzero(out > uint64(delta))
+        while rejected.size:
+            out[rejected] = self._random_uint_array(num_bits, rejected.size)
+            rejected = rejected[out[rejected] > uint64(delta)]
+        out += uint64(min % 2**64)  # Two's complement wraparound
+        return out.view(int64).reshape(size)
+
+    def _random_uint_array(self, num_bits: int, count: int) -> ndarray:
+        """
+        Returns a uint64 ndarray of `count` random uints of `num_bits` (i.e.
+        up to 64) bits each, with the same values as `count` consecutive
+        calls to `_random_uint(num_bits)`.
+
+        All bits are popped from the cache at once and split into words with
+        NumPy, instead of one cache access per value.
+        """
+        if not count:
+            return empty(0, dtype=uint64)
+        total: int = num_bits * count
+        raw: bytes = self._random_uint(total).to_bytes(-(-total // 8), "big")
+        bits: ndarray = unpackbits(frombuffer(raw, dtype=uint8))[-total:]
+        words: ndarray = zeros((count, 64), dtype=uint8)
+        words[:, 64 - num_bits :] = bits.reshape(count, num_bits)
+        return packbits(words, axis=1).view(">u8").ravel().astype(uint64)
+
+    def _sample_digits(self, bases: List[int]) -> List[int]:
+        """
+        Returns uniformly random mixed-radix digits, least significant first,
+        one for each base in `bases`.
+
+        A single uint of `P.bit_length()` bits, with `P` the product of all
+        bases, is drawn until it falls below `P` (i.e. acceptance probability
+        over one half) and then decomposed by successive division.
+        """
+        bound: int = math.prod(bases)
+        num_bits: int = (bound - 1).bit_length() or 1
+        uint: int = self._random_uint(num_bits)
+        while uint >= bound:
+            uint = self._random_uint(num_bits)
+        digits: List[int] = []
+        for base in bases:
+            uint, digit = divmod(uint, base)
+            digits.append(digit)
+        return digits
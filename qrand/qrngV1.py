@@ -21,12 +21,18 @@
 ## limitations under the License.
 
 import math
-from struct import pack, unpack
-from typing import Optional
+from struct import Struct
+from typing import Final, Optional
 
 from .helpers import ALPHABETS, encode_numeral
 from .quantum_bit_generator import QuantumBitGenerator
 
+###############################################################################
+## CONSTANTS
+###############################################################################
+_FP32: Final[Struct] = Struct(">f")
+_UINT32: Final[Struct] = Struct(">I")
+
 
 ###############################################################################
 ## QRNG (CLASS DECORATOR)
@@ -318,8 +324,8 @@ class Qrng(QuantumBitGenerator):
         """
         min, max = float(min), float(max)
         bits_as_uint: int = 0x3F800000 | self.random_uint(32 - 9)
-        to_bytes: bytes = pack(">I", bits_as_uint)
-        standard_value: float = unpack(">f", to_bytes)[0] - 1.0
+        to_bytes: bytes = _UINT32.pack(bits_as_uint)
+        standard_value: float = _FP32.unpack(to_bytes)[0] - 1.0
         return (max - min) * standard_value + min
 
     def get_random_hex(self, num_bits: Optional[int] = None) -> str:
@@ -356,9 +362,18 @@ class Qrng(QuantumBitGenerator):
         -------
         out: int
             Random int in the range [min,max].
+
+        Raises
+        ------
+        ValueError
+            If `max` is less than `min`.
         """
         delta: int = max - min
-        num_bits: int = math.floor(math.log(delta, 2)) + 1
+        if delta < 0:
+            raise ValueError(f"Invalid range [{min}, {max}].")
+        if delta == 0:
+            return min
+        num_bits: int = delta.bit_length()
         shifted: int = self.random_uint(num_bits)
         while shifted > delta:
             shifted = self.random_uint(num_bits)
@@ -20,17 +20,25 @@
 ## See the License for the specific language governing permissions and
 ## limitations under the License.
 
-from struct import pack, unpack
-from typing import Any, Callable, Final, Optional, Union
+from concurrent.futures import Future
+from threading import Thread
+from typing import Any, Callable, Final, Optional, Tuple, Union
 
-from numpy import float64, uint32, uint64
+from numpy import dtype as np_dtype
+from numpy import empty, frombuffer, ndarray, prod, uint64
 from randomgen import UserBitGenerator
 
 from .caches import BasicCache, BitCache
-from .helpers import validate_type
+from .helpers import validate_natural, validate_type
 from .platforms import QuantumPlatform
 from .protocols import HadamardProtocol, QuantumProtocol
 
+###############################################################################
+## CONSTANTS
+###############################################################################
+_FP64_ULP: Final[float] = 2.0**-52  # Unit in the last place of 1.0 (FP64)
+_FP64_HALF_ULP: Final[float] = 2.0**-53
+
 
 ###############################################################################
 ## QUANTUM BIT GENERATOR (FACADE)
@@ -50,6 +58,12 @@ class QuantumBitGenerator(UserBitGenerator):
         Toggle 32-bit BitGenerator mode. If `False` the mode will be 64-bit.
         This determines the default number of output BITS. Final: once an
         object is instantiated, it cannot be overridden.
+    prefetch: bool, default: False
+        Toggle background prefetching. If `True`, after every cache refill the
+        next batch of random bits is requested from the platform in a
+        background (daemon) thread, so that its latency overlaps with
+        consumption. Changing the platform or protocol discards any pending
+        prefetch, and `close()` stops prefetching altogether.
 
     Attributes
     ----------
@@ -64,6 +78,8 @@ class QuantumBitGenerator(UserBitGenerator):
 
     Methods
     -------
+    close() -> None:
+        Stops background prefetching, discarding any pending prefetch.
     dump_cache(flush: bool = False) -> str
         Returns all the contents stored in the cache.
     flush_cache() -> None:
@@ -72,8 +88,21 @@ class QuantumBitGenerator(UserBitGenerator):
         Load cache from bitstring.
     random_bitstring(num_bits: Optional[int] = None) -> str:
         Returns a random bitstring of a given lenght.
+    random_bytes(num_bytes: Optional[int] = None) -> bytes:
+        Returns a random bytes object of a given size.
     random_double(max: float = 1, min: float = 0) -> float:
         Returns a random double from a uniform distribution in the range [0,n).
+    random_double_array(
+        size: int, max: float = 1, min: float = 0
+    ) -> ndarray:
+        Returns an array of `size` random doubles from a uniform distribution
+        in the range [min,max).
+    random_raw(
+        size: Optional[Union[int, Tuple[int, ...]]] = None, output: bool = True
+    ) -> Optional[Union[int, ndarray]]:
+        Returns raw random values as generated by the bit generator.
+    random_raw_array(size: int, dtype: Optional[Any] = None) -> ndarray:
+        Returns an array of `size` random unsigned ints of the given `dtype`.
     random_uint(num_bits: Optional[int] = None) -> int:
         Returns a random unsigned int of a given size in bits.
 
@@ -82,21 +111,37 @@ class QuantumBitGenerator(UserBitGenerator):
     It implements an efficient strategy to retrieve random bits from the cloud
     quantum backends. Namely, on every conection, it retrieves as many bits as
     possible and stores them in a cache. This way, the total number of internet
-    connections is greatly reduced.
+    connections is greatly reduced. Optionally, it can also prefetch the next
+    batch of bits in the background to hide the latency of each connection.
     """
 
+    # Slots skip the instance dict lookup on every NumPy callback
+    __slots__ = (
+        "_platform",
+        "_protocol",
+        "_ISRAW32",
+        "_BITS",
+        "_bitcache",
+        "_prefetch",
+        "_prefetched",
+    )
+
     def __init__(
         self,
         platform: QuantumPlatform,
         protocol: QuantumProtocol = HadamardProtocol(),
         ISRAW32: bool = False,
+        prefetch: bool = False,
     ) -> None:
+        self._prefetch: bool = prefetch
+        self._prefetched: Optional[Future] = None
         self.platform: QuantumPlatform = platform
         self.protocol: QuantumProtocol = protocol
         self._ISRAW32: Final[bool] = ISRAW32
+        self._BITS: Final[int] = 32 if ISRAW32 else 64
         self._bitcache: BitCache = self._build_cache()
         super().__init__(
-            bits=self.BITS,
+            bits=self._BITS,
             next_raw=self._next_raw,
             next_32=self._next_32,
             next_64=self._next_64,
@@ -111,7 +156,7 @@ class QuantumBitGenerator(UserBitGenerator):
 
         Final: it cannot be modified after instantiation through the ISRAW32 parameter. This is required by NumPy (e.g. `random_raw()` method).
         """
-        return 32 if self._ISRAW32 else 64
+        return self._BITS
 
     @property
     def bitcache(self) -> BitCache:
@@ -131,6 +176,7 @@ class QuantumBitGenerator(UserBitGenerator):
     def platform(self, p: QuantumPlatform) -> None:
         validate_type(p, QuantumPlatform)
         self._platform = p
+        self._discard_prefetch()
 
     @property
     def protocol(self) -> QuantumProtocol:
@@ -143,6 +189,15 @@ class QuantumBitGenerator(UserBitGenerator):
     def protocol(self, p: QuantumProtocol) -> None:
         validate_type(p, QuantumProtocol)
         self._protocol = p
+        self._discard_prefetch()
+
+    def close(self) -> None:
+        """
+        Stops background prefetching, discarding any pending prefetch. The
+        generator remains usable, fetching synchronously from then on.
+        """
+        self._prefetch = False
+        self._discard_prefetch()
 
     def dump_cache(self, flush: bool = False) -> str:
         """
@@ -201,12 +256,35 @@ class QuantumBitGenerator(UserBitGenerator):
         num_bits = (
             num_bits
             if isinstance(num_bits, int) and num_bits > 0
-            else self.BITS
+            else self._BITS
         )
-        while self.bitcache.size < num_bits:
-            self._refill_cache()
+        if self.bitcache.size < num_bits:
+            self._refill_cache(num_bits)
         return self.bitcache.pop(num_bits)
 
+    def random_bytes(self, num_bytes: Optional[int] = None) -> bytes:
+        """
+        Returns a bytes object from a `num_bytes` uniform distribution.
+
+        Parameters
+        ----------
+        num_bytes: int, default: BITS/8 (i.e. 4 or 8)
+            Number of bytes to retrieve.
+
+        Returns
+        -------
+        out: bytes
+            Random bytes object of size `num_bytes`.
+        """
+        num_bytes = (
+            num_bytes
+            if isinstance(num_bytes, int) and num_bytes > 0
+            else self._BITS // 8
+        )
+        if self.bitcache.size < num_bytes * 8:
+            self._refill_cache(num_bytes * 8)
+        return self.bitcache.pop_bytes(num_bytes)
+
     def random_double(self, max: float = 1, min: float = 0) -> float:
         """
         Returns a random double from a uniform distribution in the range
@@ -227,7 +305,10 @@ class QuantumBitGenerator(UserBitGenerator):
         Notes
         -----
         Implementation based on the double-precision floating-point format
-        (FP64) [1]_.
+        (FP64) [1]_: 52 random bits are taken as the mantissa of a double in
+        [1,2), and one is subtracted. Since the result is exactly the
+        mantissa scaled by 2^-52, it is computed as such without packing the
+        bits into an actual FP64 binary representation.
 
         References
         ----------
@@ -237,11 +318,112 @@ class QuantumBitGenerator(UserBitGenerator):
             point_format&oldid=1024750735 (accessed May 25, 2021).
         """
         min, max = float(min), float(max)
-        bits_as_uint: int = 0x3FF0000000000000 | self.random_uint(64 - 12)
-        to_bytes: bytes = pack(">Q", bits_as_uint)
-        standard_value: float = unpack(">d", to_bytes)[0] - 1.0
+        standard_value: float = self.random_uint(52) * _FP64_ULP
         return (max - min) * standard_value + min
 
+    def random_double_array(
+        self, size: int, max: float = 1, min: float = 0
+    ) -> ndarray:
+        """
+        Returns an array of `size` random doubles from a uniform distribution
+        in the range [min,max).
+
+        Parameters
+        ----------
+        size: int
+            Number of random doubles to retrieve.
+        max: float, default: 1
+            Upper bound (exclusive) for the random doubles.
+        min: float, default: 0
+            Lower bound (inclusive) for the random doubles.
+
+        Returns
+        -------
+        out: ndarray
+            Array of `size` random doubles (float64).
+
+        Notes
+        -----
+        Each double is built from the top 53 bits of a random 64-bit word as
+        `(uint64 >> 11) * 2^-53`, NumPy's own conversion, vectorized over the
+        whole array. Values therefore differ from those of `size` consecutive
+        calls to `random_double()`, which consume 52 bits each.
+        """
+        uints: ndarray = self.random_raw_array(size, uint64)
+        standard_values: ndarray = (uints >> uint64(11)) * _FP64_HALF_ULP
+        return (max - min) * standard_values + min
+
+    def random_raw(
+        self,
+        size: Optional[Union[int, Tuple[int, ...]]] = None,
+        output: bool = True,
+    ) -> Optional[Union[int, ndarray]]:
+        """
+        Returns raw random values as generated by the bit generator.
+
+        Parameters
+        ----------
+        size: int or Tuple[int, ...], default: None
+            Output shape. If `None` a single value is returned.
+        output: bool, default: True
+            Output values. If `False` values are drawn but not returned.
+
+        Returns
+        -------
+        out: uint64, ndarray or None
+            Random values of BITS (i.e. 32 or 64) bits as uint64.
+
+        Notes
+        -----
+        Arrays are read from the cache in bulk (see `random_raw_array`)
+        instead of through one NumPy callback per value. Values are the same
+        as those of consecutive single draws.
+        """
+        if size is None:
+            return super().random_raw(size, output)
+        raw: ndarray = self.random_raw_array(int(prod(size)))
+        return raw.astype(uint64).reshape(size) if output else None
+
+    def random_raw_array(
+        self, size: int, dtype: Optional[Any] = None
+    ) -> ndarray:
+        """
+        Returns an array of `size` random unsigned ints of the given `dtype`.
+
+        Parameters
+        ----------
+        size: int
+            Number of random unsigned ints to retrieve.
+        dtype: data-type, default: uint32 or uint64 (i.e. BITS)
+            NumPy unsigned integer type of the output.
+
+        Returns
+        -------
+        out: ndarray
+            Array of `size` random unsigned ints.
+
+        Raises
+        ------
+        TypeError
+            If `dtype` is not an unsigned integer type.
+
+        Notes
+        -----
+        The required bits are retrieved from the cache in a single block and
+        reinterpreted as big-endian words, yielding the same values as
+        `size` consecutive calls to `random_uint()` with the `dtype` width.
+        """
+        validate_natural(size, zero=True)
+        dt: np_dtype = np_dtype(
+            dtype if dtype is not None else f"u{self._BITS//8}"
+        )
+        if dt.kind != "u":
+            raise TypeError(f"Invalid dtype {dt}, expected unsigned integer.")
+        if not size:
+            return empty(0, dtype=dt)
+        raw: bytes = self.random_bytes(size * dt.itemsize)
+        return frombuffer(raw, dtype=dt.newbyteorder(">")).astype(dt)
+
     def random_uint(self, num_bits: Optional[int] = None) -> int:
         """
         Returns a random unsigned int from a `num_bits` uniform distribution.
@@ -256,7 +438,14 @@ class QuantumBitGenerator(UserBitGenerator):
         out: int
             Random unsigned int of size `num_bits`.
         """
-        return int(self.random_bitstring(num_bits), base=2)
+        num_bits = (
+            num_bits
+            if isinstance(num_bits, int) and num_bits > 0
+            else self._BITS
+        )
+        if self.bitcache.size < num_bits:
+            self._refill_cache(num_bits)
+        return self.bitcache.pop_uint(num_bits)
 
     ############################### PRIVATE API ###############################
     def _build_cache(self) -> BitCache:
@@ -270,56 +459,106 @@ class QuantumBitGenerator(UserBitGenerator):
         """
         return BasicCache()
 
-    def _refill_cache(self) -> None:
+    def _refill_cache(self, num_bits: int = 1) -> None:
         """
-        Refill cache by fetching new random bits.
+        Refill cache by fetching new random bits until it holds at least
+        `num_bits`. If prefetching, a pending background fetch is consumed
+        first and a new one is submitted once done.
+
+        Parameters
+        ----------
+        num_bits: int, default: 1
+            Minimum number of bits required in cache.
         """
-        bitstring: str = self.platform.fetch_random_bits(self.protocol)
-        if not bitstring:
-            raise RuntimeError("Failed to fetch random bits.")
-        self.bitcache.push(bitstring)
+        platform: QuantumPlatform = self.platform
+        protocol: QuantumProtocol = self.protocol
+        while self.bitcache.size < num_bits:
+            pending, self._prefetched = self._prefetched, None
+            bitstring: str = (
+                pending.result()
+                if pending
+                else platform.fetch_random_bits(protocol)
+            )
+            if not bitstring:
+                raise RuntimeError("Failed to fetch random bits.")
+            self.bitcache.push(bitstring)
+        if self._prefetch:
+            self._prefetched = self._submit_prefetch(platform, protocol)
+
+    def _discard_prefetch(self) -> None:
+        """
+        Drop the pending background fetch, if any, so that its bits (produced
+        with the platform and protocol at submission time) are never used.
+        """
+        pending, self._prefetched = self._prefetched, None
+        if pending:
+            pending.cancel()
+
+    @staticmethod
+    def _submit_prefetch(
+        platform: QuantumPlatform, protocol: QuantumProtocol
+    ) -> Future:
+        """
+        Fetch random bits in a background daemon thread, which never blocks
+        interpreter exit even if the remote job is still running.
+
+        Parameters
+        ----------
+        platform: QuantumPlatform
+            The quantum platform to fetch from.
+        protocol: QuantumProtocol
+            The quantum protocol to fetch with.
+
+        Returns
+        -------
+        out: Future
+            Future holding the fetched bitstring.
+        """
+        future: Future = Future()
+
+        def fetch() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(platform.fetch_random_bits(protocol))
+            except BaseException as error:
+                future.set_exception(error)
+
+        Thread(target=fetch, daemon=True).start()
+        return future
 
     ############################# NUMPY INTERFACE #############################
     @property
-    def _next_raw(self) -> Callable[[Any], Union[uint32, uint64]]:
+    def _next_raw(self) -> Callable[[Any], int]:
         """
         A callable that returns either 64 or 32 random bits. It must accept a
         single input which is a void pointer to a memory address.
         """
         return self._next_32 if self._ISRAW32 else self._next_64
 
-    @property
-    def _next_32(self) -> Callable[[Any], uint32]:
+    def _next_32(self, void_p: Any) -> int:
         """
-        A callable with the same signature as as next_raw that always returns
-        a random numpy 32-bit unsigned int.
+        Same signature as next_raw, always returns a random 32-bit unsigned
+        int.
         """
+        if self._bitcache.size < 32:
+            self._refill_cache(32)
+        return self._bitcache.pop_uint(32)
 
-        def next_32(void_p: Any) -> uint32:
-            return uint32(self.random_uint(32))
-
-        return next_32
-
-    @property
-    def _next_64(self) -> Callable[[Any], uint64]:
+    def _next_64(self, void_p: Any) -> int:
         """
-        A callable with the same signature as as next_raw that always returns
-        a random numpy 64-bit unsigned int.
+        Same signature as next_raw, always returns a random 64-bit unsigned
+        int.
         """
+        if self._bitcache.size < 64:
+            self._refill_cache(64)
+        return self._bitcache.pop_uint(64)
 
-        def next_64(void_p: Any) -> uint64:
-            return uint64(self.random_uint(64))
-
-        return next_64
-
-    @property
-    def _next_double(self) -> Callable[[Any], float64]:
+    def _next_double(self, void_p: Any) -> float:
         """
-        A callable with the same signature as as next_raw that always return
-        a random double in [0,1).
+        Same signature as next_raw, always returns a random double in [0,1).
+        Equivalent to `random_double()`.
         """
-
-        def next_double(void_p: Any) -> float64:
-            return float64(self.random_double(1, 0))
-
-        return next_double
+        if self._bitcache.size < 52:
+            self._refill_cache(52)
+        return self._bitcache.pop_uint(52) * _FP64_ULP
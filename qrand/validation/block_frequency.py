@@ -20,9 +20,15 @@
 ## See the License for the specific language governing permissions and
 ## limitations under the License.
 
+from numpy import frombuffer, int64, ndarray, uint8
 from scipy.special import gammaincc
 
-from ..helpers import ALPHABETS, validate_natural, validate_numeral
+from ..helpers import (
+    ALPHABETS,
+    validate_natural,
+    validate_numeral,
+    validate_type,
+)
 from . import ValidationStrategy
 
 
@@ -86,18 +92,21 @@ class BlockFrequencyValidation(ValidationStrategy):
 
     ############################### VALIDATION ###############################
     def validate(self, bitstring: str) -> bool:
-        validate_numeral(bitstring, ALPHABETS["BINARY"])
+        validate_type(bitstring, str)
         n: int = len(bitstring)
         if n < 100:
             return False
-        N: int = n // self.blocksize
-        ki_square_obs: float = 0.0
-        for i in range(N):
-            block: str = bitstring[
-                i * self.blocksize : (i + 1) * self.blocksize
-            ]
-            pi: float = block.count("1") / self.blocksize
-            ki_square_obs += (pi - 0.5) ** 2
-        ki_square_obs *= 4 * self.blocksize
+        validate_numeral(bitstring, ALPHABETS["BINARY"])
+        M: int = self.blocksize
+        N: int = n // M
+        blocks: ndarray = frombuffer(bitstring.encode(), dtype=uint8)
+        blocks = blocks[: N * M].reshape(N, M)
+        # 4M * sum((ones/M - 1/2)^2) == sum((2*ones - M)^2) / M, where
+        # 2*ones - M == 2*ascii_sums - (2*ord("0") + 1)*M, updated in place
+        offsets: ndarray = blocks.sum(axis=1, dtype=int64)
+        offsets *= 2
+        offsets -= (2 * ord("0") + 1) * M
+        deviations: int = int(offsets @ offsets)
+        ki_square_obs: float = deviations / M
         p_value: float = gammaincc(N / 2, ki_square_obs / 2)
         return p_value >= 0.01
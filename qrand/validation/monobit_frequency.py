@@ -20,10 +20,20 @@
 ## See the License for the specific language governing permissions and
 ## limitations under the License.
 
-from math import erfc, sqrt
+from math import sqrt
+from typing import Final, List
 
-from ..helpers import ALPHABETS, validate_numeral
+from numpy import frombuffer, int64, ndarray, uint8, zeros
+
+from ..helpers import ALPHABETS, validate_numeral, validate_type
 from . import ValidationStrategy
+from .validation import _ERFC_ARG_MAX
+
+###############################################################################
+## CONSTANTS
+###############################################################################
+# erfc(|s_n| / sqrt(2n)) >= 0.01  <=>  |s_n| <= _S_OBS_MAX * sqrt(n)
+_S_OBS_MAX: Final[float] = sqrt(2) * _ERFC_ARG_MAX
 
 
 class MonobitFrequencyValidation(ValidationStrategy):
@@ -41,6 +51,8 @@ class MonobitFrequencyValidation(ValidationStrategy):
     -------
     validate(bitstring: str) -> bool
         Validates the randomness/entropy in an input bitstring.
+    validate_batch(bitstrings: List[str]) -> ndarray
+        Validates several bitstrings of equal length at once.
 
     Notes
     -----
@@ -60,13 +72,44 @@ class MonobitFrequencyValidation(ValidationStrategy):
     """
 
     def validate(self, bitstring: str) -> bool:
-        validate_numeral(bitstring, ALPHABETS["BINARY"])
+        validate_type(bitstring, str)
         n: int = len(bitstring)
         if n < 100:
             return False
-        s_n: float = 0.0
-        for bit in bitstring:
-            s_n += 2 * int(bit) - 1
-        s_obs: float = s_n / sqrt(n)
-        p_value: float = erfc(s_obs / sqrt(2))
-        return p_value >= 0.01
+        validate_numeral(bitstring, ALPHABETS["BINARY"])
+        s_n: int = 2 * bitstring.count("1") - n
+        return abs(s_n) <= _S_OBS_MAX * sqrt(n)
+
+    def validate_batch(self, bitstrings: List[str]) -> ndarray:
+        """
+        Validates several bitstrings of equal length at once.
+
+        Parameters
+        ----------
+        bitstrings: List[str]
+            The bitstrings to be tested, all of the same length.
+
+        Returns
+        -------
+        out: ndarray
+            Boolean array with the outcome of `validate()` for each input.
+
+        Raises
+        ------
+        ValueError
+            If the bitstrings are not all of the same length.
+        """
+        validate_type(bitstrings, list)
+        if not bitstrings:
+            return zeros(0, dtype=bool)
+        n: int = len(bitstrings[0])
+        if any(len(b) != n for b in bitstrings):
+            raise ValueError("Input bitstrings must all have the same length.")
+        if n < 100:
+            return zeros(len(bitstrings), dtype=bool)
+        joined: str = "".join(bitstrings)
+        validate_numeral(joined, ALPHABETS["BINARY"])
+        table: ndarray = frombuffer(joined.encode(), dtype=uint8)
+        table = table.reshape(len(bitstrings), n)
+        ones: ndarray = table.sum(axis=1, dtype=int64) - ord("0") * n
+        return abs(2 * ones - n) <= _S_OBS_MAX * sqrt(n)
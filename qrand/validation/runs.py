@@ -20,10 +20,11 @@
 ## See the License for the specific language governing permissions and
 ## limitations under the License.
 
-from math import erfc, sqrt
+from math import sqrt
 
-from ..helpers import ALPHABETS, validate_numeral
+from ..helpers import ALPHABETS, validate_numeral, validate_type
 from . import ValidationStrategy
+from .validation import _ERFC_ARG_MAX
 
 
 class RunsValidation(ValidationStrategy):
@@ -60,20 +61,17 @@ class RunsValidation(ValidationStrategy):
     """
 
     def validate(self, bitstring: str) -> bool:
-        validate_numeral(bitstring, ALPHABETS["BINARY"])
+        validate_type(bitstring, str)
         n: int = len(bitstring)
         if n < 100:
             return False
+        validate_numeral(bitstring, ALPHABETS["BINARY"])
         pi: float = bitstring.count("1") / n
         # validating whether frequency run test was run
         if abs(pi - 0.5) >= 2 / sqrt(n):
             return False
-        v_obs: int = 1
-        for i in range(0, n - 1):
-            if bitstring[i] != bitstring[i + 1]:
-                v_obs += 1
-        p_value: float = erfc(
-            (v_obs - (2 * n * pi * (1 - pi)))
-            / (2 * sqrt(2 * n) * pi * (1 - pi))
-        )
-        return p_value >= 0.01
+        # Neither pattern can overlap itself: each match is one transition
+        v_obs: int = 1 + bitstring.count("01") + bitstring.count("10")
+        pi_q: float = pi * (1 - pi)
+        deviation: float = abs(v_obs - 2 * n * pi_q)
+        return deviation <= _ERFC_ARG_MAX * 2 * sqrt(2 * n) * pi_q
@@ -21,6 +21,13 @@
 ## limitations under the License.
 
 from abc import ABC, abstractmethod
+from typing import Final
+
+###############################################################################
+## CONSTANTS
+###############################################################################
+# erfc(x) >= 0.01  <=>  x <= _ERFC_ARG_MAX, since erfc is decreasing
+_ERFC_ARG_MAX: Final[float] = 1.8213863677184499  # erfcinv(0.01)
 
 
 ###############################################################################
@@ -0,0 +1,77 @@
+##    _____  _____
+##   |  __ \|  __ \    AUTHOR: Pedro Rivero
+##   | |__) | |__) |   ---------------------------------
+##   |  ___/|  _  /    DATE: May 25, 2021
+##   | |    | | \ \    ---------------------------------
+##   |_|    |_|  \_\   https://github.com/pedrorrivero
+##
+
+## Copyright 2020 Pedro Rivero
+##
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+##
+## http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+import pytest
+from qiskit import BasicAer
+from qiskit.providers import Provider
+
+
+###############################################################################
+## STUB PROVIDER
+###############################################################################
+class StubProvider(Provider):
+    """
+    Offline provider counting how many times its backends are listed.
+    """
+
+    def __init__(self) -> None:
+        self.lookups: int = 0
+
+    def backends(self, name=None, filters=None, **kwargs):
+        self.lookups += 1
+        return [BasicAer.get_backend("qasm_simulator")]
+
+
+class StubClock:
+    """
+    Monotonic clock stand-in, advanced by hand through `now`.
+    """
+
+    def __init__(self, now: float = 100.0) -> None:
+        self.now: float = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+###############################################################################
+## FIXTURES
+###############################################################################
+@pytest.fixture
+def stub_provider():
+    return StubProvider()
+
+
+@pytest.fixture
+def stub_backend_lookup(monkeypatch):
+    """
+    Returns a function patching `monotonic` and `least_busy` in the given
+    module, which returns the `StubClock` now in use.
+    """
+
+    def patch(module) -> StubClock:
+        clock: StubClock = StubClock()
+        monkeypatch.setattr(module, "monotonic", clock)
+        monkeypatch.setattr(module, "least_busy", lambda bs: bs[0])
+        return clock
+
+    return patch
@@ -0,0 +1,72 @@
+##    _____  _____
+##   |  __ \|  __ \    AUTHOR: Pedro Rivero
+##   | |__) | |__) |   ---------------------------------
+##   |  ___/|  _  /    DATE: May 25, 2021
+##   | |    | | \ \    ---------------------------------
+##   |_|    |_|  \_\   https://github.com/pedrorrivero
+##
+
+## Copyright 2020 Pedro Rivero
+##
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+##
+## http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+import pytest
+
+from qrand.helpers import ALPHABETS, decode_numeral, encode_numeral
+
+
+###############################################################################
+## ENCODE
+###############################################################################
+class TestEncodeNumeral:
+    def test_power_of_two_bases(self):
+        assert encode_numeral(0, ALPHABETS["BINARY"]) == "0"
+        assert encode_numeral(1000, ALPHABETS["BINARY"]) == "1111101000"
+        assert encode_numeral(35, ALPHABETS["OCTAL"]) == "43"
+        assert encode_numeral(255, ALPHABETS["HEX"]) == "FF"
+        assert encode_numeral(256, ALPHABETS["HEX"]) == "100"
+        assert encode_numeral(0, ALPHABETS["BASE32"]) == "A"
+        assert (
+            encode_numeral(2**64 - 1, ALPHABETS["BASE32"]) == "P" + "7" * 12
+        )
+        assert (
+            encode_numeral(2**64 - 1, ALPHABETS["BASE64"]) == "P" + "/" * 10
+        )
+        assert encode_numeral(2**66 - 1, ALPHABETS["BASE64"]) == "/" * 11
+        base_alphabet = "".join(chr(0x100 + i) for i in range(1024))
+        assert encode_numeral(0, base_alphabet) == chr(0x100)
+        assert encode_numeral(2**20 - 1, base_alphabet) == chr(0x4FF) * 2
+        assert encode_numeral(2**20 + 5, base_alphabet) == "".join(
+            (chr(0x101), chr(0x100), chr(0x105))
+        )
+
+    def test_other_bases(self):
+        assert encode_numeral(0, ALPHABETS["NUMBERS"]) == "0"
+        assert encode_numeral(12345, ALPHABETS["NUMBERS"]) == "12345"
+        assert encode_numeral(27, ALPHABETS["UPPER"]) == "BB"
+        assert encode_numeral(5, "ab") == "bab"
+        assert encode_numeral(5, "aabb") == "bab"
+
+    def test_round_trip(self):
+        for base_alphabet in ALPHABETS.values():
+            for uint in (0, 1, 63, 64, 12345, 2**64 - 1):
+                numeral = encode_numeral(uint, base_alphabet)
+                assert decode_numeral(numeral, base_alphabet) == uint
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            encode_numeral(1, "")
+        with pytest.raises(ValueError):
+            encode_numeral(-1, ALPHABETS["HEX"])
+        with pytest.raises(TypeError):
+            encode_numeral(1.0, ALPHABETS["HEX"])
@@ -29,6 +29,7 @@ from qiskit.providers.models import BackendConfiguration
 from qiskit.result import Counts, Result
 from randomgen import UserBitGenerator
 
+import qrand._qiskit_bit_generator as qbg
 from qrand._qiskit_bit_generator import BitCache, QiskitBitGenerator
 
 
@@ -62,15 +63,60 @@ class TestBitCache:
             bitcache.pop(len(cache) + 1)
         assert (
             bitcache.pop(3) == "100"
-            and bitcache._cache == cache[3:]
+            and bitcache.dump() == cache[3:]
             and bitcache.size == len(cache) - 3
         )
         assert (
             bitcache.pop(len(cache) - 3) == cache[3:]
-            and bitcache._cache == ""
+            and bitcache.dump() == ""
             and bitcache.size == 0
         )
 
+    def test_pop_bytes(self):
+        bitcache = BitCache()
+        cache = "100" * 100
+        bitcache.push(cache)
+        with pytest.raises(ValueError):
+            bitcache.pop_bytes(0)
+        with pytest.raises(RuntimeError):
+            bitcache.pop_bytes(len(cache) // 8 + 1)
+        assert (
+            bitcache.pop_bytes(2) == int(cache[:16], 2).to_bytes(2, "big")
+            and bitcache.pop(3) == cache[16:19]
+            and bitcache.pop_bytes(3)
+            == int(cache[19:43], 2).to_bytes(3, "big")
+            and bitcache.dump() == cache[43:]
+            and bitcache.size == len(cache) - 43
+        )
+        bitcache.flush()
+        bitcache.push("10100101")
+        assert bitcache.pop_bytes(1) == b"\xa5" and bitcache.size == 0
+
+    def test_pop_uint(self):
+        bitcache = BitCache()
+        cache = "100" * 100
+        bitcache.push(cache)
+        with pytest.raises(ValueError):
+            bitcache.pop_uint(0)
+        with pytest.raises(RuntimeError):
+            bitcache.pop_uint(len(cache) + 1)
+        assert (
+            bitcache.pop_uint(5) == 0b10010
+            and bitcache.pop_uint(64) == int(cache[5:69], 2)
+            and bitcache.dump() == cache[69:]
+            and bitcache.size == len(cache) - 69
+        )
+        bitcache.flush()
+        bitcache.push(cache)
+        assert (
+            bitcache.pop_uint(64) == int(cache[:64], 2)
+            and bitcache.pop_uint(32) == int(cache[64:96], 2)
+            and bitcache.pop_uint(16) == int(cache[96:112], 2)
+            and bitcache.pop_uint(8) == int(cache[112:120], 2)
+            and bitcache.pop_uint(24) == int(cache[120:144], 2)
+            and bitcache.dump() == cache[144:]
+        )
+
     def test_push(self):
         bitcache = BitCache()
         cache = "100" * 100
@@ -79,7 +125,14 @@ class TestBitCache:
         with pytest.raises(ValueError):
             bitcache.push("abc")
         bitcache.push(cache)
-        assert bitcache._cache == cache and bitcache.size == len(cache)
+        assert bitcache.dump() == cache and bitcache.size == len(cache)
+        bitcache.push("1")
+        bitcache.push("")
+        bitcache.push("0110")
+        assert (
+            bitcache.dump() == cache + "10110"
+            and bitcache.size == len(cache) + 5
+        )
 
     ############################ PUBLIC PROPERTIES ############################
     def test_state(self):
@@ -127,6 +180,13 @@ class TestQiskitBitGenerator:
     #         QiskitBitGenerator.get_best_backend(provider, lambda b: False)
 
     ############################# PUBLIC METHODS #############################
+    def test_close(self):
+        bitgen = QiskitBitGenerator()
+        bitgen.load_cache("100" * 100)
+        bitgen.close()
+        assert bitgen._prefetched is None
+        assert bitgen.random_bitstring(3) == "100"
+
     def test_dump_cache(self):
         bitgen = QiskitBitGenerator()
         cache = "100" * 100
@@ -135,7 +195,7 @@ class TestQiskitBitGenerator:
         assert (
             bitgen.dump_cache(flush=True) == cache
             and bitgen._bitcache.size == 0
-            and bitgen._bitcache._cache == ""
+            and bitgen._bitcache.dump() == ""
         )
 
     def test_flush_cache(self):
@@ -143,7 +203,7 @@ class TestQiskitBitGenerator:
         cache = "100" * 100
         bitgen.load_cache(cache)
         bitgen.flush_cache()
-        assert bitgen._bitcache.size == 0 and bitgen._bitcache._cache == ""
+        assert bitgen._bitcache.size == 0 and bitgen._bitcache.dump() == ""
 
     def test_load_cache(self):
         bitgen = QiskitBitGenerator()
@@ -156,12 +216,12 @@ class TestQiskitBitGenerator:
         bitgen.load_cache(cache)
         assert (
             bitgen._bitcache.size == 2 * len(cache)
-            and bitgen._bitcache._cache == cache + cache
+            and bitgen._bitcache.dump() == cache + cache
         )
         bitgen.load_cache(cache, flush=True)
         assert (
             bitgen._bitcache.size == len(cache)
-            and bitgen._bitcache._cache == cache
+            and bitgen._bitcache.dump() == cache
         )
 
     def test_random_bitstring(self):
@@ -208,6 +268,50 @@ class TestQiskitBitGenerator:
             and bitgen.random_double(n) == 1.1428571428571423
         )
 
+    def test_random_double_array(self):
+        bitgen = QiskitBitGenerator()
+        cache = "100" * 100
+        bitgen.load_cache(cache)
+        array = bitgen.random_double_array(2)
+        assert array.dtype == float64 and array.tolist() == [
+            (int(cache[i : i + 64], 2) >> 11) * 2.0**-53 for i in (0, 64)
+        ]
+        array = bitgen.random_double_array(1, 4, -4)
+        assert array.tolist() == [
+            8 * (int(cache[128:192], 2) >> 11) * 2.0**-53 - 4
+        ]
+        assert bitgen.random_double_array(0).size == 0
+
+    def test_random_raw(self):
+        bitgen = QiskitBitGenerator()
+        cache = "100" * 1000
+        bitgen.load_cache(cache)
+        raw = bitgen.random_raw((2, 3))
+        assert raw.dtype == uint64 and raw.shape == (2, 3)
+        assert raw.ravel().tolist() == [
+            int(cache[i : i + 64], 2) for i in range(0, 384, 64)
+        ]
+        assert bitgen.random_raw() == int(cache[384:448], 2)
+        assert bitgen.random_raw(2, output=False) is None
+        assert bitgen.dump_cache() == cache[576:]
+
+    def test_random_raw_array(self):
+        bitgen = QiskitBitGenerator()
+        cache = "100" * 100
+        bitgen.load_cache(cache)
+        raw = bitgen.random_raw_array(2)
+        assert raw.dtype == uint64 and raw.tolist() == [
+            10540996613548315209,
+            2635249153387078802,
+        ]
+        raw = bitgen.random_raw_array(2, uint32)
+        assert raw.dtype == uint32 and raw.tolist() == [
+            int(cache[128:160], 2),
+            int(cache[160:192], 2),
+        ]
+        with pytest.raises(TypeError):
+            bitgen.random_raw_array(1, float64)
+
     def test_random_uint(self):
         bitgen = QiskitBitGenerator()
         cache = "100" * 100
@@ -239,8 +343,37 @@ class TestQiskitBitGenerator:
     #     assert bitgen.set_state(provider=provider)
 
     ############################# PRIVATE METHODS #############################
-    # def test_fetch_random_bits(self):
-    #     pass ## TODO!!!
+    def test_fetch_random_bits(self, stub_provider, stub_backend_lookup):
+        clock = stub_backend_lookup(qbg)
+        provider = stub_provider
+        bitgen = QiskitBitGenerator(
+            provider=provider,
+            backend_filter=lambda b: True,
+            max_bits_per_request=100,
+            backend_ttl=10,
+        )
+        assert provider.lookups == 1
+        assert bitgen.state["dynamic_backend"]["ttl"] == 10.0
+        bitgen._fetch_random_bits()
+        fetched = bitgen._bitcache.size
+        clock.now += 9.9
+        bitgen._fetch_random_bits()
+        assert provider.lookups == 1 and bitgen._bitcache.size == 2 * fetched
+        clock.now += 0.1
+        bitgen._fetch_random_bits()
+        bitgen._fetch_random_bits()
+        assert provider.lookups == 2
+        bitgen.set_state(backend_filter=lambda b: True)
+        bitgen._fetch_random_bits()
+        assert provider.lookups == 3
+        assert bitgen.set_state(backend_ttl=0)
+        bitgen._fetch_random_bits()
+        bitgen._fetch_random_bits()
+        assert provider.lookups == 5
+        with pytest.raises(ValueError):
+            bitgen.set_state(backend_ttl=-1)
+        with pytest.raises(TypeError):
+            QiskitBitGenerator(backend_ttl="10")
 
     def test_parse_backend_config(self):
         bitgen = QiskitBitGenerator()
@@ -350,6 +483,10 @@ class TestQiskitBitGenerator:
         assert bitgen._job_partition == (24, 65536, 1)
         bitgen.state = {"max_bits_per_request": 4}
         assert bitgen._job_partition == (4, 1, 1)
+        bitgen.state = {"max_bits_per_request": 0}
+        assert bitgen._job_partition == (24, 65536, 1)
+        bitgen.state = {"backend": BasicAer.get_backend("unitary_simulator")}
+        assert bitgen._job_partition == (14, 1, 1)
 
     def test_memory(self):
         bitgen = QiskitBitGenerator()
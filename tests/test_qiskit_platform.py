@@ -0,0 +1,59 @@
+##    _____  _____
+##   |  __ \|  __ \    AUTHOR: Pedro Rivero
+##   | |__) | |__) |   ---------------------------------
+##   |  ___/|  _  /    DATE: May 25, 2021
+##   | |    | | \ \    ---------------------------------
+##   |_|    |_|  \_\   https://github.com/pedrorrivero
+##
+
+## Copyright 2020 Pedro Rivero
+##
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+##
+## http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+import pytest
+
+import qrand.platforms.qiskit.platform as qiskit_platform
+from qrand.platforms import QiskitPlatform
+
+
+###############################################################################
+## QISKIT PLATFORM
+###############################################################################
+class TestQiskitPlatform:
+    ############################## BACKEND TTL ##############################
+    def test_backend_ttl(self, stub_provider, stub_backend_lookup):
+        clock = stub_backend_lookup(qiskit_platform)
+        provider = stub_provider
+        platform = QiskitPlatform(
+            provider=provider, backend_filter=lambda b: True, backend_ttl=10
+        )
+        assert provider.lookups == 1
+        platform.retrieve_backend()
+        clock.now = 109.9
+        platform.retrieve_backend()
+        assert provider.lookups == 1
+        clock.now = 110.0
+        platform.retrieve_backend()
+        platform.retrieve_backend()
+        assert provider.lookups == 2
+        platform.backend_filter = lambda b: True
+        platform.retrieve_backend()
+        assert provider.lookups == 3
+        platform.backend_ttl = 0
+        platform.retrieve_backend()
+        platform.retrieve_backend()
+        assert provider.lookups == 5
+        with pytest.raises(ValueError):
+            platform.backend_ttl = -1
+        with pytest.raises(TypeError):
+            platform.backend_ttl = "10"
@@ -20,6 +20,10 @@
 ## See the License for the specific language governing permissions and
 ## limitations under the License.
 
+import pytest
+from numpy import complex128, float64, int64, isclose, uint64
+from numpy.random import Generator
+
 from qrand import QiskitBitGenerator
 from qrand.qrng import Qrng
 
@@ -77,6 +81,77 @@ class TestBitCache:
     #         == -3.0000000000000004 - 1.1428571428571432j
     #     )
 
+    def test_get_random_complex_polar_size(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        cache = "100" * 1000
+        bitgen.load_cache(cache + cache)
+        complexes = [qrng.get_random_complex_polar(4, 3.14) for _ in range(6)]
+        array = qrng.get_random_complex_polar(4, 3.14, size=(3, 2))
+        assert array.shape == (3, 2) and array.dtype == complex128
+        assert isclose(array.ravel(), complexes, rtol=1e-15).all()
+
+    def test_get_random_complex_rect_size(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        cache = "100" * 1000
+        bitgen.load_cache(cache + cache)
+        complexes = [
+            qrng.get_random_complex_rect(-4, 3, -2, 1) for _ in range(3)
+        ]
+        array = qrng.get_random_complex_rect(-4, 3, -2, 1, size=3)
+        assert array.shape == (3,) and array.dtype == complex128
+        assert array.tolist() == complexes
+
+    def test_get_random_base32(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        bitgen.load_cache("100" * 1000)
+        for num_bits, expected in (
+            (1, "B"),
+            (5, "E"),
+            (10, "SJ"),
+            (64, "CJESJESJESJES"),
+            (101, "SJESJESJESJESJESJESJ"),
+        ):
+            assert qrng.get_random_base32(num_bits) == expected
+
+    def test_get_random_base64(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        bitgen.load_cache("100" * 1000)
+        for num_bits, expected in (
+            (1, "B"),
+            (6, "J"),
+            (12, "JJ"),
+            (64, "CSSSSSSSSSS"),
+            (101, "JJJJJJJJJJJJJJJJJ"),
+        ):
+            assert qrng.get_random_base64(num_bits) == expected
+
+    def test_get_random_bitstrings(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        cache = "100" * 1000
+        bitgen.load_cache(cache)
+        assert qrng.get_random_bitstrings(0) == []
+        assert qrng.get_random_bitstrings(2) == [cache[:64], cache[64:128]]
+        assert qrng.get_random_bitstrings(3, 4) == [
+            cache[128:132],
+            cache[132:136],
+            cache[136:140],
+        ]
+
+    def test_get_random_bytes(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        cache = "100" * 1000
+        bitgen.load_cache(cache)
+        assert qrng.get_random_bytes() == int(cache[:64], 2).to_bytes(8, "big")
+        assert qrng.get_random_bytes(3) == int(cache[64:88], 2).to_bytes(
+            3, "big"
+        )
+
     def test_get_random_double(self):
         bitgen = QiskitBitGenerator()
         qrng = Qrng(bitgen)
@@ -85,6 +160,27 @@ class TestBitCache:
         assert qrng.get_random_double() == 0.1428571428571428
         assert qrng.get_random_double(-4, 4) == -2.8571428571428577
 
+    def test_get_random_double_size(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        cache = "100" * 1000
+        bitgen.load_cache(cache + cache)
+        doubles = [qrng.get_random_double(-4, 4) for _ in range(6)]
+        array = qrng.get_random_double(-4, 4, size=(2, 3))
+        assert array.shape == (2, 3) and array.dtype == float64
+        assert array.ravel().tolist() == doubles
+
+    def test_get_random_double_array(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        cache = "100" * 1000
+        bitgen.load_cache(cache)
+        doubles = [qrng.get_random_double(0, 1) for _ in range(3)]
+        array = qrng.get_random_double_array(3, 0, 1)
+        assert array.dtype == float64 and array.tolist() == doubles
+        array = qrng.get_random_double_array(2)
+        assert ((-1 <= array) & (array < 1)).all()
+
     def test_get_random_float(self):
         bitgen = QiskitBitGenerator()
         qrng = Qrng(bitgen)
@@ -93,13 +189,46 @@ class TestBitCache:
         assert qrng.get_random_float() == 0.14285707473754883
         assert qrng.get_random_float(-4, 4) == -1.7142858505249023
 
+    def test_get_random_float_size(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        cache = "100" * 1000
+        bitgen.load_cache(cache + cache)
+        floats = [qrng.get_random_float(-4, 4) for _ in range(6)]
+        array = qrng.get_random_float(-4, 4, size=(3, 2))
+        assert array.shape == (3, 2) and array.dtype == float64
+        assert array.ravel().tolist() == floats
+
     def test_get_random_int(self):
         bitgen = QiskitBitGenerator()
         qrng = Qrng(bitgen)
         cache = "001" * 1000
         bitgen.load_cache(cache)
-        assert qrng.get_random_int() == -1
-        assert qrng.get_random_int(-4, 4) == -2
+        assert qrng.get_random_int() == 0
+        assert qrng.get_random_int(-5, 5) == -3
+        assert qrng.get_random_int(3, 3) == 3
+        with pytest.raises(ValueError):
+            qrng.get_random_int(1, -1)
+
+    def test_get_random_int_size(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        cache = "100" * 1000
+        bitgen.load_cache(cache + cache)
+        ints = [qrng.get_random_int(-4, 3) for _ in range(6)]
+        array = qrng.get_random_int(-4, 3, size=(2, 3))
+        assert array.shape == (2, 3) and array.dtype == int64
+        assert array.ravel().tolist() == ints
+        bitgen.load_cache("111" + "010" * 999, flush=True)
+        assert qrng.get_random_int(0, 4, size=3).tolist() == [2, 2, 2]
+        bitgen.load_cache(cache, flush=True)
+        array = qrng.get_random_int(-(2**63), 2**63 - 1, size=1)
+        assert array.tolist() == [int(cache[:64], 2) - 2**63]
+        assert qrng.get_random_int(5, 5, size=2).tolist() == [5, 5]
+        array = qrng.get_random_int(0, 2**70, size=2)
+        assert array.dtype == object and (array <= 2**70).all()
+        with pytest.raises(ValueError):
+            qrng.get_random_int(1, -1, size=2)
 
     def test_get_random_int32(self):
         bitgen = QiskitBitGenerator()
@@ -115,6 +244,49 @@ class TestBitCache:
         bitgen.load_cache(cache)
         assert qrng.get_random_int64() == 10540996613548315209
 
+    def test_get_random_int64_array(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        cache = "100" * 1000
+        bitgen.load_cache(cache)
+        array = qrng.get_random_int64_array(3)
+        assert array.dtype == uint64 and array.tolist() == [
+            int(cache[i : i + 64], 2) for i in range(0, 192, 64)
+        ]
+        assert qrng.get_random_int64_array(0).size == 0
+
+    def test_get_random_normal(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        cache = "100" * 1000
+        bitgen.load_cache(cache)
+        reference = QiskitBitGenerator()
+        reference.load_cache(cache)
+        gen = Generator(reference)
+        assert qrng.get_random_normal() == gen.normal()
+        assert qrng.get_random_normal(2, 3) == gen.normal(2, 3)
+        assert (qrng.get_random_normal(size=4) == gen.normal(size=4)).all()
+
+    def test_get_random_string(self):
+        bitgen = QiskitBitGenerator()
+        qrng = Qrng(bitgen)
+        cache = "100" * 1000
+        bitgen.load_cache(cache)
+        assert qrng.get_random_string(8, "01") == "10010010"
+        assert qrng.get_random_string(8, "0123456789") == "292"
+        assert len(qrng.get_random_string()) == 11
+        with pytest.raises(ValueError):
+            qrng.get_random_string(8, "0")
+        with pytest.raises(ValueError):
+            qrng.get_random_string(8, "00")
+        bitgen.load_cache(cache, flush=True)
+        assert qrng.get_random_string(8, "0011") == "10010010"
+        for alphabet in ("abc", "aabbcc", "0123456789"):
+            base = len(set(alphabet))
+            for num_bits in (1, 7, 64, 100):
+                length = len(qrng.get_random_string(num_bits, alphabet))
+                assert base**length >= 2**num_bits > base ** (length - 1)
+
     def test_state(self):
         bitgen = QiskitBitGenerator()
         qrng = Qrng(bitgen)
@@ -0,0 +1,43 @@
+##    _____  _____
+##   |  __ \|  __ \    AUTHOR: Pedro Rivero
+##   | |__) | |__) |   ---------------------------------
+##   |  ___/|  _  /    DATE: May 25, 2021
+##   | |    | | \ \    ---------------------------------
+##   |_|    |_|  \_\   https://github.com/pedrorrivero
+##
+
+## Copyright 2020 Pedro Rivero
+##
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+##
+## http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+import pytest
+
+from qrand.platforms import QiskitPlatform
+from qrand.qrngV1 import Qrng
+
+
+###############################################################################
+## QRNG (V1)
+###############################################################################
+class TestQrng:
+    ############################# PUBLIC METHODS #############################
+    def test_get_random_int(self):
+        qrng = Qrng(QiskitPlatform())
+        cache = "001" * 1000
+        qrng.load_cache(cache)
+        assert qrng.get_random_int(3, 3) == 3
+        assert qrng.get_random_int(-2, -2) == -2
+        assert qrng.dump_cache() == cache
+        with pytest.raises(ValueError):
+            qrng.get_random_int(-1, 1)
+        assert qrng.dump_cache() == cache
@@ -0,0 +1,92 @@
+##    _____  _____
+##   |  __ \|  __ \    AUTHOR: Pedro Rivero
+##   | |__) | |__) |   ---------------------------------
+##   |  ___/|  _  /    DATE: May 25, 2021
+##   | |    | | \ \    ---------------------------------
+##   |_|    |_|  \_\   https://github.com/pedrorrivero
+##
+
+## Copyright 2020 Pedro Rivero
+##
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+##
+## http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+from typing import List
+
+from qrand import QuantumBitGenerator
+from qrand.platforms import QuantumPlatform
+from qrand.protocols import HadamardProtocol, QuantumProtocol
+
+
+###############################################################################
+## STUB PLATFORM
+###############################################################################
+class StubPlatform(QuantumPlatform):
+    """
+    Offline platform returning the 64-bit index (1, 2, 3...) of each fetch.
+    """
+
+    def __init__(self) -> None:
+        self.protocols: List[QuantumProtocol] = []
+
+    def create_circuit(self, num_qubits):
+        raise NotImplementedError
+
+    def create_job(self, circuit, backend, num_measurements):
+        raise NotImplementedError
+
+    def fetch_random_bits(self, protocol: QuantumProtocol) -> str:
+        self.protocols.append(protocol)
+        return f"{len(self.protocols):064b}"
+
+    def retrieve_backend(self):
+        raise NotImplementedError
+
+
+###############################################################################
+## QUANTUM BIT GENERATOR
+###############################################################################
+class TestQuantumBitGenerator:
+    ################################ PREFETCH ################################
+    def test_prefetch_order(self):
+        platform = StubPlatform()
+        bitgen = QuantumBitGenerator(platform, prefetch=True)
+        assert [bitgen.random_uint(64) for _ in range(4)] == [1, 2, 3, 4]
+        bitgen._prefetched.result()
+        assert len(platform.protocols) == 5
+
+    def test_prefetch_setter_invalidation(self):
+        platform = StubPlatform()
+        protocol = HadamardProtocol()
+        bitgen = QuantumBitGenerator(platform, prefetch=True)
+        assert bitgen.random_uint(64) == 1
+        bitgen._prefetched.result()  # Fetch 2 uses the old protocol
+        bitgen.protocol = protocol
+        assert bitgen._prefetched is None
+        assert bitgen.random_uint(64) == 3
+        assert platform.protocols[2] is protocol
+        bitgen._prefetched.result()
+        new_platform = StubPlatform()
+        bitgen.platform = new_platform
+        assert bitgen._prefetched is None
+        assert bitgen.random_uint(64) == 1
+        assert new_platform.protocols[0] is protocol
+
+    def test_close(self):
+        platform = StubPlatform()
+        bitgen = QuantumBitGenerator(platform, prefetch=True)
+        assert bitgen.random_uint(64) == 1
+        bitgen._prefetched.result()
+        bitgen.close()
+        assert bitgen._prefetched is None
+        assert bitgen.random_uint(64) == 3
+        assert bitgen._prefetched is None and len(platform.protocols) == 3
@@ -0,0 +1,76 @@
+##    _____  _____
+##   |  __ \|  __ \    AUTHOR: Pedro Rivero
+##   | |__) | |__) |   ---------------------------------
+##   |  ___/|  _  /    DATE: May 25, 2021
+##   | |    | | \ \    ---------------------------------
+##   |_|    |_|  \_\   https://github.com/pedrorrivero
+##
+
+## Copyright 2020 Pedro Rivero
+##
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+##
+## http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+import pytest
+
+from qrand.validation.monobit_frequency import MonobitFrequencyValidation
+from qrand.validation.runs import RunsValidation
+
+RANDOM_BITSTRING: str = (
+    "1100100100001111110110101010001000100001011010001100001000110100"
+    "1100010011000110011000101000101110000000110111000001110011010001"
+    "0010100100000010010011100000100010001010011001111100110001110100"
+    "0000001000001011101111101010011000111011000100111001101100100010"
+)
+
+
+###############################################################################
+## MONOBIT FREQUENCY
+###############################################################################
+class TestMonobitFrequencyValidation:
+    ############################# PUBLIC METHODS #############################
+    def test_validate(self):
+        validation = MonobitFrequencyValidation()
+        assert validation.validate(RANDOM_BITSTRING)
+        assert validation.validate("0" * 62 + "1" * 38)
+        assert not validation.validate("0" * 63 + "1" * 37)
+        assert not validation.validate("0" * 70 + "1" * 30)
+        assert not validation.validate("1" * 70 + "0" * 30)
+
+    def test_validate_batch(self):
+        validation = MonobitFrequencyValidation()
+        bitstrings = [
+            RANDOM_BITSTRING[:100],
+            "0" * 63 + "1" * 37,
+            RANDOM_BITSTRING[100:200],
+            "0" * 62 + "1" * 38,
+            "01" * 50,
+            "1" * 100,
+        ]
+        batch = validation.validate_batch(bitstrings)
+        assert batch.tolist() == [validation.validate(b) for b in bitstrings]
+        assert batch.tolist() == [True, False, True, True, True, False]
+        with pytest.raises(ValueError):
+            validation.validate_batch(["01" * 50, "01" * 51])
+
+
+###############################################################################
+## RUNS
+###############################################################################
+class TestRunsValidation:
+    ############################# PUBLIC METHODS #############################
+    def test_validate(self):
+        validation = RunsValidation()
+        assert validation.validate(RANDOM_BITSTRING)
+        assert not validation.validate("01" * 100)
+        assert not validation.validate("0" * 100 + "1" * 100)
+        assert not validation.validate("0" * 70 + "1" * 30)